@@ -56,7 +56,14 @@ class DetectorContext:
 
 
 class BaseDetector(ABC):
-    """Abstract base class for XEW pattern detectors."""
+    """Abstract base class for XEW pattern detectors.
+
+    pattern_id, pattern_name and alert_eligible may be implemented either as
+    properties or, when constant, as plain class attributes.
+
+    Detector modules (``pNNN_*.py``) expose their class as a module-level
+    ``DETECTOR_CLS`` so auto-discovery does not have to scan the module.
+    """
 
     def __init__(self):
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
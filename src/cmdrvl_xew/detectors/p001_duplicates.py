@@ -579,3 +579,7 @@ class DuplicateFactsDetector(BaseDetector):
         )
 
         return signature_bytes.hex()
+
+
+# Detector class picked up by DetectorRegistry.auto_discover.
+DETECTOR_CLS = DuplicateFactsDetector
@@ -470,3 +470,7 @@ class AnchoringDefectsDetector(BaseDetector):
 
         examples.sort(key=lambda r: (r.get('context_ref', ''), r.get('value', '')))
         return examples[:limit]
+
+
+# Detector class picked up by DetectorRegistry.auto_discover.
+DETECTOR_CLS = AnchoringDefectsDetector
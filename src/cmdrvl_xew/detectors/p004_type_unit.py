@@ -523,3 +523,7 @@ class TypeUnitNumericDetector(BaseDetector):
         )
 
         return signature_bytes.hex()
+
+
+# Detector class picked up by DetectorRegistry.auto_discover.
+DETECTOR_CLS = TypeUnitNumericDetector
@@ -7,9 +7,16 @@ Focuses on mismatches between schema references and actual namespace usage in fa
 
 from __future__ import annotations
 
-from typing import Dict, List, Any, Set, Optional
+from collections import defaultdict
+from operator import attrgetter
+from types import MappingProxyType
+from typing import ClassVar, Dict, Final, List, Any, Mapping, Set, Optional, Tuple
+import functools
 import logging
+import os
 import re
+import stat
+import sys
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from urllib.parse import urlparse, unquote
@@ -17,37 +24,120 @@ from urllib.parse import urlparse, unquote
 from ._base import BaseDetector, DetectorContext, DetectorFinding, DetectorInstance
 from ..artifacts import extract_schema_refs
 from ..util import (
-    canonical_signature_p005,
+    canonical_signature_p005_from_digests,
     generate_finding_id,
     create_finding_summary,
-    instance_id_from_signature
+    instance_id_from_signature,
+    p005_payload_digests,
 )
 
 logger = logging.getLogger(__name__)
 
 
+# Issue codes for P005 taxonomy inconsistencies (read-only; pinned in xew_issue_codes.v1.json)
+P005_ISSUE_CODES: Final[Mapping[str, str]] = MappingProxyType({
+    'mixed_taxonomy_versions': 'Facts use more than one version of the same base taxonomy',
+    'namespace_schema_ref_mismatch': 'Fact namespaces not declared by the referenced extension schema(s)',
+})
+P005_ISSUE_CODE_SET: Final[frozenset[str]] = frozenset(P005_ISSUE_CODES)
+
 _VERSION_RE = re.compile(r"/(\d{4}-\d{2}-\d{2})$")
 
 _XML_SCHEMA_NS = "http://www.w3.org/2001/XMLSchema"
 _XSD_IMPORT_TAG = f"{{{_XML_SCHEMA_NS}}}import"
 _XSD_INCLUDE_TAG = f"{{{_XML_SCHEMA_NS}}}include"
 _XSD_REDEFINE_TAG = f"{{{_XML_SCHEMA_NS}}}redefine"
+_XSD_TAGS = frozenset({_XSD_IMPORT_TAG, _XSD_INCLUDE_TAG, _XSD_REDEFINE_TAG})
+_XSD_READ_CHUNK = 64 * 1024
+_REMOTE_HREF_PREFIXES = ("http://", "https://")
+_FACT_NAMESPACE_GETTER = attrgetter("qname.namespaceURI")
+
+# Filings (and their include chains) reuse the same handful of hrefs; memoize parsing.
+_parse_href = functools.lru_cache(maxsize=4096)(urlparse)
+
+
+def _is_regular_file(path: Path, stat_cache: dict[Path, bool]) -> bool:
+    """Return True if path is a regular file, stat'ing each path at most once."""
+    cached = stat_cache.get(path)
+    if cached is not None:
+        return cached
+    try:
+        result = stat.S_ISREG(os.stat(path).st_mode)
+    except OSError:
+        result = False
+    stat_cache[path] = result
+    return result
+
+
+def _scan_xsd_declarations(path: Path) -> tuple[str | None, list[str], list[str]]:
+    """Stream an XSD and return (targetNamespace, import namespaces, include/redefine locations).
+
+    Uses an incremental pull parser fed in fixed-size chunks and clears each
+    element once it closes, so large schemas are never materialized as a full
+    tree. Raises ET.ParseError on malformed XML.
+    """
+    import_tag = _XSD_IMPORT_TAG
+    xsd_tags = _XSD_TAGS
+
+    target_namespace: str | None = None
+    imports: list[str] = []
+    locations: list[str] = []
+    seen_root = False
+
+    parser = ET.XMLPullParser(events=("start", "end"))
+
+    def drain() -> None:
+        nonlocal target_namespace, seen_root
+        for event, elem in parser.read_events():
+            if event == "start":
+                if not seen_root:
+                    seen_root = True
+                    target_namespace = elem.get("targetNamespace")
+                continue
+            tag = elem.tag
+            if tag in xsd_tags:
+                if tag == import_tag:
+                    ns = elem.get("namespace")
+                    if ns:
+                        imports.append(ns)
+                else:
+                    loc = elem.get("schemaLocation")
+                    if loc:
+                        locations.append(loc)
+            elem.clear()
+
+    with open(path, "rb") as fh:
+        while True:
+            chunk = fh.read(_XSD_READ_CHUNK)
+            if not chunk:
+                break
+            parser.feed(chunk)
+            drain()
+    parser.close()
+    drain()
+
+    return target_namespace, imports, locations
 
 
 class TaxonomyInconsistencyDetector(BaseDetector):
     """Detector for XEW-P005: Taxonomy Inconsistency Checks."""
 
-    @property
-    def pattern_id(self) -> str:
-        return "XEW-P005"
-
-    @property
-    def pattern_name(self) -> str:
-        return "Inconsistent Taxonomy References"
-
-    @property
-    def alert_eligible(self) -> bool:
-        return True  # P005 is v1 shipping set, alert-eligible
+    _BREAK_TRIGGERS: ClassVar[Tuple[Mapping[str, str], ...]] = (
+        MappingProxyType({
+            'id': 'XEW-BT003',
+            'summary': 'Taxonomy Refresh - Taxonomy updates trigger stricter validation rules'
+        }),
+        MappingProxyType({
+            'id': 'XEW-BT004',
+            'summary': 'Validator Tightening - Rule enforcement changes surface tolerated taxonomy errors'
+        }),
+    )
+    _rule_basis_cache: ClassVar[Optional[Tuple[List[Dict[str, Any]], Tuple[Dict[str, Any], ...]]]] = None
+
+    # Constant pattern metadata as plain class attributes (no descriptor call per access).
+    pattern_id: ClassVar[str] = "XEW-P005"
+    pattern_name: ClassVar[str] = "Inconsistent Taxonomy References"
+    alert_eligible: ClassVar[bool] = True  # P005 is v1 shipping set, alert-eligible
 
     def detect(self, context: DetectorContext) -> List[DetectorFinding]:
         """
@@ -64,9 +154,11 @@ class TaxonomyInconsistencyDetector(BaseDetector):
         try:
             schema_ref_hrefs = self._extract_schema_ref_hrefs(context)
             fact_namespaces = self._extract_fact_namespaces(context.xbrl_model)
+            if not fact_namespaces:
+                self.logger.info("No fact namespaces found; skipping taxonomy checks")
+                return []
             declared_namespaces = self._extract_declared_namespaces(schema_ref_hrefs, context)
             inconsistencies = self._analyze_taxonomy_inconsistencies(
-                schema_ref_hrefs=schema_ref_hrefs,
                 declared_namespaces=declared_namespaces,
                 fact_namespaces=fact_namespaces,
             )
@@ -77,7 +169,12 @@ class TaxonomyInconsistencyDetector(BaseDetector):
                 return []
 
             # Create finding for inconsistencies
-            finding = self._create_finding(inconsistencies, context)
+            finding = self._create_finding(
+                inconsistencies,
+                context,
+                schema_ref_hrefs=schema_ref_hrefs,
+                fact_namespaces=fact_namespaces,
+            )
             self.logger.info(f"Created finding with {len(finding.instances)} instances")
 
             return [finding]
@@ -100,14 +197,7 @@ class TaxonomyInconsistencyDetector(BaseDetector):
         except Exception as e:
             self.logger.warning(f"Failed to extract schemaRef hrefs from primary document: {e}")
 
-        normalized: list[str] = []
-        seen: set[str] = set()
-        for href in hrefs:
-            value = str(href or "").strip()
-            if not value or value in seen:
-                continue
-            seen.add(value)
-            normalized.append(value)
+        normalized = {value for value in (str(href or "").strip() for href in hrefs) if value}
         if normalized:
             return sorted(normalized)
 
@@ -116,13 +206,16 @@ class TaxonomyInconsistencyDetector(BaseDetector):
         model_doc = getattr(xbrl_model, "modelDocument", None) if xbrl_model is not None else None
         refs = getattr(model_doc, "referencesDocument", None) if model_doc is not None else None
         if isinstance(refs, dict):
-            fallback: list[str] = []
-            for ref_doc in refs.keys():
+            # Snapshot Arelle's mapping once; names are collected in the same pass.
+            names: set[str] = set()
+            for ref_doc in list(refs):
                 uri = getattr(ref_doc, "uri", None) or getattr(ref_doc, "filepath", None)
                 if not uri:
                     continue
-                fallback.append(Path(str(uri)).name)
-            fallback = sorted({h for h in fallback if h})
+                name = Path(str(uri)).name
+                if name:
+                    names.add(name)
+            fallback = sorted(names)
             if fallback:
                 self.logger.warning("Falling back to Arelle referencesDocument for schema refs (may be less stable)")
                 return fallback
@@ -142,23 +235,26 @@ class TaxonomyInconsistencyDetector(BaseDetector):
         artifacts_root = Path(context.artifacts_dir)
         base_dir = Path(context.primary_document_path).parent
         declared: set[str] = set()
+        stat_cache: dict[Path, bool] = {}
 
         for href in schema_ref_hrefs:
             resolved = self._resolve_local_href(href, base_dir=base_dir, root_dir=artifacts_root)
             if resolved is None:
                 continue
-            if not resolved.is_file():
+            if not _is_regular_file(resolved, stat_cache):
                 self.logger.warning(f"schemaRef href resolves to missing local file: {href} -> {resolved}")
                 continue
-            declared |= self._extract_xsd_declared_namespaces(resolved, root_dir=artifacts_root)
+            declared |= self._extract_xsd_declared_namespaces(
+                resolved, root_dir=artifacts_root, stat_cache=stat_cache
+            )
 
         return declared
 
     def _resolve_local_href(self, href: str, *, base_dir: Path, root_dir: Path) -> Path | None:
         href = (href or "").strip()
-        if not href:
+        if not href or href.startswith(_REMOTE_HREF_PREFIXES):
             return None
-        parsed = urlparse(href)
+        parsed = _parse_href(href)
         if parsed.scheme or parsed.netloc:
             return None
         if not parsed.path:
@@ -174,12 +270,26 @@ class TaxonomyInconsistencyDetector(BaseDetector):
             return None
         return resolved
 
-    def _extract_xsd_declared_namespaces(self, schema_path: Path, *, root_dir: Path, max_files: int = 50) -> set[str]:
+    def _extract_xsd_declared_namespaces(
+        self,
+        schema_path: Path,
+        *,
+        root_dir: Path,
+        max_files: int = 50,
+        stat_cache: dict[Path, bool] | None = None,
+    ) -> set[str]:
         """Return namespaces declared by an extension schema via targetNamespace + xs:import.
 
         Includes namespaces from xs:include / xs:redefine'd schemas when those
         schemaLocations resolve to local files under root_dir.
         """
+        if stat_cache is None:
+            stat_cache = {}
+        # Bind hot module globals/attributes to locals for the walk below.
+        log = self.logger
+        resolve = self._resolve_local_href
+        intern = sys.intern
+
         declared: set[str] = set()
         seen: set[Path] = set()
         stack: list[Path] = [schema_path]
@@ -189,71 +299,69 @@ class TaxonomyInconsistencyDetector(BaseDetector):
             if current in seen:
                 continue
             if len(seen) >= max_files:
-                self.logger.warning(f"Reached max XSD include depth while parsing {schema_path.name}")
+                log.warning(f"Reached max XSD include depth while parsing {schema_path.name}")
                 break
             seen.add(current)
 
             try:
-                tree = ET.parse(current)
+                target_namespace, imports, locations = _scan_xsd_declarations(current)
             except Exception as e:
-                self.logger.warning(f"Failed to parse XSD {current.name}: {e}")
+                log.warning(f"Failed to parse XSD {current.name}: {e}")
                 continue
 
-            root = tree.getroot()
-            target_namespace = root.get("targetNamespace")
             if target_namespace:
-                declared.add(target_namespace.strip())
-
-            for imp in root.iter(_XSD_IMPORT_TAG):
-                ns = imp.get("namespace")
-                if ns:
-                    declared.add(ns.strip())
-
-            for include_tag in (_XSD_INCLUDE_TAG, _XSD_REDEFINE_TAG):
-                for inc in root.iter(include_tag):
-                    loc = inc.get("schemaLocation")
-                    if not loc:
-                        continue
-                    resolved = self._resolve_local_href(loc, base_dir=current.parent, root_dir=root_dir)
-                    if resolved is None or not resolved.is_file():
-                        continue
-                    stack.append(resolved)
+                declared.add(intern(target_namespace.strip()))
+            for ns in imports:
+                declared.add(intern(ns.strip()))
+            for loc in locations:
+                resolved = resolve(loc, base_dir=current.parent, root_dir=root_dir)
+                if resolved is None or not _is_regular_file(resolved, stat_cache):
+                    continue
+                stack.append(resolved)
 
         return declared
 
-    def _extract_fact_namespaces(self, xbrl_model) -> Set[str]:
+    def _extract_fact_namespaces(self, xbrl_model) -> frozenset[str]:
         """Extract unique namespaces used in facts."""
-        fact_namespaces = set()
+        fact_namespaces: set[str] = set()
+        add = fact_namespaces.add
 
         try:
-            for fact in getattr(xbrl_model, 'facts', []):
-                if hasattr(fact, 'qname') and fact.qname:
-                    namespace = fact.qname.namespaceURI
-                    if namespace:
-                        fact_namespaces.add(namespace)
+            # EAFP: facts almost always carry a qname, and hasattr() would pay
+            # for the attribute lookup (and its exception path) twice.
+            get_namespace = _FACT_NAMESPACE_GETTER
+            for fact in getattr(xbrl_model, 'facts', ()):
+                try:
+                    namespace = get_namespace(fact)
+                except AttributeError:
+                    continue
+                if namespace:
+                    add(namespace)
 
         except Exception as e:
             self.logger.warning(f"Failed to extract fact namespaces: {e}")
 
-        return fact_namespaces
+        # Intern the (few) distinct URIs so they share storage with the declared
+        # namespaces and set operations between them hit the identity fast path.
+        return frozenset(map(sys.intern, fact_namespaces))
 
     def _analyze_taxonomy_inconsistencies(
         self,
         *,
-        schema_ref_hrefs: list[str],
         declared_namespaces: set[str],
-        fact_namespaces: Set[str],
+        fact_namespaces: frozenset[str],
     ) -> List[Dict[str, Any]]:
-        """Analyze schema references vs fact namespaces for inconsistencies."""
-        inconsistencies: List[Dict[str, Any]] = []
+        """Analyze schema references vs fact namespaces for inconsistencies.
 
-        schema_ref_hrefs_sorted = sorted({ref for ref in schema_ref_hrefs if ref})
+        Callers skip this when there are no fact namespaces (detect() returns early).
+        """
+        inconsistencies: List[Dict[str, Any]] = []
         fact_namespaces_sorted = sorted(fact_namespaces)
 
-        declared_namespaces_sorted = sorted({ns for ns in declared_namespaces if ns})
+        declared = {ns for ns in declared_namespaces if ns}
         missing: list[str] = []
-        if declared_namespaces_sorted:
-            missing = sorted(set(fact_namespaces_sorted) - set(declared_namespaces_sorted))
+        if declared:
+            missing = sorted(fact_namespaces.difference(declared))
         if missing:
             details_parts = []
             details_parts.append(f"namespaces_in_facts_not_declared_in_schema_imports={missing}")
@@ -261,8 +369,6 @@ class TaxonomyInconsistencyDetector(BaseDetector):
                 {
                     "issue_code": "namespace_schema_ref_mismatch",
                     "details": "; ".join(details_parts),
-                    "schema_refs": schema_ref_hrefs_sorted,
-                    "namespaces_in_facts": fact_namespaces_sorted,
                 }
             )
 
@@ -276,47 +382,61 @@ class TaxonomyInconsistencyDetector(BaseDetector):
                 {
                     "issue_code": "mixed_taxonomy_versions",
                     "details": details,
-                    "schema_refs": schema_ref_hrefs_sorted,
-                    "namespaces_in_facts": fact_namespaces_sorted,
                 }
             )
 
         return inconsistencies
 
     def _detect_mixed_taxonomy_versions(self, namespaces: List[str]) -> Dict[str, Set[str]]:
-        versions_by_base: Dict[str, Set[str]] = {}
+        versions_by_base: Dict[str, Set[str]] = defaultdict(set)
+        version_search = _VERSION_RE.search
         for ns in namespaces:
-            match = _VERSION_RE.search(ns)
+            match = version_search(ns)
             if not match:
                 continue
-            version = match.group(1)
-            base = ns[:match.start()]
-            versions_by_base.setdefault(base, set()).add(version)
+            versions_by_base[ns[:match.start()]].add(match.group(1))
         return {base: versions for base, versions in versions_by_base.items() if len(versions) > 1}
 
     def _create_finding(
         self,
         inconsistencies: List[Dict[str, Any]],
         context: DetectorContext,
+        *,
+        schema_ref_hrefs: List[str],
+        fact_namespaces: frozenset[str],
     ) -> DetectorFinding:
         """Create a finding from taxonomy inconsistencies."""
 
         # Generate finding ID
         finding_id = generate_finding_id(context.accession, self.pattern_id)
 
+        # Every instance carries the same schema_refs/namespaces payload: build
+        # the sorted lists and their digests once and share them (instances
+        # hold references, not per-instance copies).
+        schema_refs = sorted({ref for ref in schema_ref_hrefs if ref})
+        namespaces_in_facts = sorted(fact_namespaces)
+        payload_digests = p005_payload_digests(schema_refs, namespaces_in_facts)
+
         # Create instances for each inconsistency type
         instances = []
         for inconsistency in inconsistencies:
-            instance = self._create_instance(inconsistency, context)
+            instance = self._create_instance(
+                inconsistency,
+                context,
+                schema_refs=schema_refs,
+                namespaces_in_facts=namespaces_in_facts,
+                payload_digests=payload_digests,
+            )
             if instance:
                 instances.append(instance)
 
         # Apply deterministic ordering and truncation
         finding_summary = create_finding_summary(
-            [inst.__dict__ for inst in instances],
+            instances,
             instance_limit=100,
             example_limit=10,
-            include_examples=False  # Schema compliance
+            include_examples=False,  # Schema compliance
+            sort_key=attrgetter("instance_id"),
         )
 
         # Create finding with proper structure
@@ -329,7 +449,7 @@ class TaxonomyInconsistencyDetector(BaseDetector):
             human_review_required=True,
             break_triggers=self.get_break_triggers(),
             rule_basis=self.load_rule_basis(),
-            instances=[DetectorInstance(**inst) for inst in finding_summary['instances']],
+            instances=finding_summary['instances'],
             mechanism="Taxonomy reference inconsistencies can cause filing rejection when validators enforce stricter schema validation or when referenced taxonomies change",
             why_not_fatal_yet="Current validation may tolerate minor inconsistencies, but stricter taxonomy validation or schema updates could surface these as blocking errors"
         )
@@ -339,21 +459,25 @@ class TaxonomyInconsistencyDetector(BaseDetector):
     def _create_instance(
         self,
         inconsistency: Dict[str, Any],
-        context: DetectorContext
+        context: DetectorContext,
+        *,
+        schema_refs: List[str],
+        namespaces_in_facts: List[str],
+        payload_digests: Tuple[str, str],
     ) -> Optional[DetectorInstance]:
-        """Create a detector instance from a taxonomy inconsistency."""
+        """Create a detector instance from a taxonomy inconsistency.
+
+        payload_digests must be p005_payload_digests(schema_refs, namespaces_in_facts).
+        """
         try:
             issue_code = inconsistency['issue_code']
+            if issue_code not in P005_ISSUE_CODE_SET:
+                self.logger.error(f"Unknown P005 issue code: {issue_code}")
+                return None
             details = inconsistency['details']
-            schema_ref_hrefs = inconsistency.get('schema_refs', [])
-            namespaces_in_facts = inconsistency.get('namespaces_in_facts', [])
-
-            # Generate canonical signature
-            signature_bytes = canonical_signature_p005(
-                issue_code=issue_code,
-                schema_refs=schema_ref_hrefs,
-                namespaces=namespaces_in_facts
-            )
+
+            # Generate canonical signature (same bytes as canonical_signature_p005)
+            signature_bytes = canonical_signature_p005_from_digests(issue_code, *payload_digests)
 
             # Generate instance ID from signature
             instance_id = instance_id_from_signature(signature_bytes)
@@ -361,7 +485,7 @@ class TaxonomyInconsistencyDetector(BaseDetector):
             # Build instance data
             instance_data = {
                 "issue_code": issue_code,
-                "schema_refs": schema_ref_hrefs,
+                "schema_refs": schema_refs,
                 "namespaces_in_facts": namespaces_in_facts,
                 "details": details,
             }
@@ -379,29 +503,28 @@ class TaxonomyInconsistencyDetector(BaseDetector):
 
     def get_break_triggers(self) -> List[Dict[str, str]]:
         """Get break triggers for P005 pattern."""
-        return [
-            {
-                'id': 'XEW-BT003',
-                'summary': 'Taxonomy Refresh - Taxonomy updates trigger stricter validation rules'
-            },
-            {
-                'id': 'XEW-BT004',
-                'summary': 'Validator Tightening - Rule enforcement changes surface tolerated taxonomy errors'
-            },
-        ]
+        return [dict(trigger) for trigger in self._BREAK_TRIGGERS]
 
     def load_rule_basis(self) -> List[Dict[str, Any]]:
-        """Load rule basis for P005 pattern from registry."""
+        """Load rule basis for P005 pattern from registry.
+
+        Flattened citations are memoized on the class against the registry's
+        rule list object, so a reloaded rule basis map invalidates the cache.
+        """
         from .registry import get_registry
 
         try:
             registry = get_registry()
             rule_basis = registry.get_rule_basis(self.pattern_id)
             if rule_basis:
-                citations = []
-                for rule in rule_basis:
-                    citations.extend(rule.get('citations', []))
-                return citations
+                cached = TaxonomyInconsistencyDetector._rule_basis_cache
+                if cached is None or cached[0] is not rule_basis:
+                    citations = []
+                    for rule in rule_basis:
+                        citations.extend(rule.get('citations', []))
+                    cached = (rule_basis, tuple(citations))
+                    TaxonomyInconsistencyDetector._rule_basis_cache = cached
+                return list(cached[1])
         except Exception as e:
             self.logger.warning(f"Failed to load rule basis from registry: {e}")
         return []
@@ -410,3 +533,7 @@ class TaxonomyInconsistencyDetector(BaseDetector):
         """Compute canonical signature for instance ID generation."""
         # This would extract parameters and call canonical_signature_p005
         raise NotImplementedError("Use _create_instance for P005 detection")
+
+
+# Detector class picked up by DetectorRegistry.auto_discover.
+DETECTOR_CLS = TaxonomyInconsistencyDetector
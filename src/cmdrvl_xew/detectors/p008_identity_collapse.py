@@ -495,3 +495,7 @@ class InstrumentIdentityCollapseDetector(BaseDetector):
         if snapshot is None:
             return absent_registry_lookup()
         return snapshot.lookup(instrument)
+
+
+# Detector class picked up by DetectorRegistry.auto_discover.
+DETECTOR_CLS = InstrumentIdentityCollapseDetector
@@ -502,3 +502,7 @@ def generated_artifact_from_p009_findings(
                     "generated_at": generated_at,
                 }
     return None
+
+
+# Detector class picked up by DetectorRegistry.auto_discover.
+DETECTOR_CLS = InstrumentIdentityDriftDetector
@@ -1,12 +1,18 @@
 """Detector registry for XEW pattern detection."""
 
 import logging
-from typing import Dict, List, Type, Set, Any, Optional, Tuple
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Type, Set, Any, Optional, Tuple
+from importlib import resources
 from pathlib import Path
 import importlib
-import json
+import inspect
+import re
 
 from ._base import BaseDetector, DetectorContext, DetectorFinding, DetectorError
+from ..util import _SHA256_HEX_RE, read_json
 
 logger = logging.getLogger(__name__)
 
@@ -22,27 +28,55 @@ PATTERN_PRIORITIES = {
     "XEW-P009": 6,  # Temporal instrument identity drift - review-grade join fragility
 }
 
+# Priority for patterns missing from PATTERN_PRIORITIES (sorts after all known ones)
+UNKNOWN_PATTERN_PRIORITY = 999
+
+# Detector module file names: p001_*.py, p002_*.py, etc.
+_DETECTOR_MODULE_RE = re.compile(r"^p\d{3}_\w+\.py$")
+
+# Upper bound on detector threads; detectors mostly read the shared Arelle model.
+MAX_DETECTOR_WORKERS = 8
+
+# Maximum detector errors retained in last_run_errors for a non-strict run.
+MAX_RECORDED_DETECTOR_ERRORS = 32
+
 
 class DetectorRegistry:
     """Central registry for XEW pattern detectors."""
 
     def __init__(self):
-        self._detectors: Dict[str, BaseDetector] = {}
+        # Registered classes by pattern ID; instances are created on first use.
         self._detector_classes: Dict[str, Type[BaseDetector]] = {}
+        self._detectors: Dict[str, BaseDetector] = {}
         self._rule_basis_map: Dict[str, List[Dict]] = {}
+        self._rule_basis_valid_cache: Dict[str, bool] = {}
         self._issue_codes_map: Dict[str, List[str]] = {}
+        self._discovery_cache: Dict[str, List[str]] = {}
+        self._alert_eligible: Set[str] = set()
+        self._patterns_by_priority: Optional[List[str]] = None
+        self._break_trigger_cache: Dict[str, Mapping[str, str]] = {}
+        self.last_run_errors: List[DetectorError] = []
+        self.last_run_error_count = 0
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
     def register(self, detector_class: Type[BaseDetector]) -> None:
         """
         Register a detector class.
 
+        Detectors declaring pattern_id and alert_eligible as class attributes
+        are instantiated lazily, on first use; others are instantiated here
+        to read that metadata.
+
         Args:
             detector_class: Class that inherits from BaseDetector
         """
-        # Instantiate to get pattern info
-        instance = detector_class()
-        pattern_id = instance.pattern_id
+        instance: Optional[BaseDetector] = None
+        metadata = _class_metadata(detector_class)
+        if metadata is None:
+            # Metadata is exposed as instance properties: instantiate to read it
+            instance = detector_class()
+            metadata = (instance.pattern_id, instance.alert_eligible)
+        pattern_id, alert_eligible = metadata
 
         existing_class = self._detector_classes.get(pattern_id)
         if existing_class is detector_class:
@@ -52,33 +86,49 @@ class DetectorRegistry:
             self.logger.warning(f"Overwriting existing detector for {pattern_id}")
 
         self._detector_classes[pattern_id] = detector_class
-        self._detectors[pattern_id] = instance
+        if instance is not None:
+            self._detectors[pattern_id] = instance
+        else:
+            self._detectors.pop(pattern_id, None)
+        if alert_eligible:
+            self._alert_eligible.add(pattern_id)
+        else:
+            self._alert_eligible.discard(pattern_id)
+        self._invalidate_caches()
 
         self.logger.info(f"Registered detector: {pattern_id} ({detector_class.__name__})")
 
     def unregister(self, pattern_id: str) -> None:
         """Unregister a detector by pattern ID."""
-        if pattern_id in self._detectors:
-            del self._detectors[pattern_id]
+        if pattern_id in self._detector_classes:
             del self._detector_classes[pattern_id]
+            self._detectors.pop(pattern_id, None)
+            self._alert_eligible.discard(pattern_id)
+            self._invalidate_caches()
             self.logger.info(f"Unregistered detector: {pattern_id}")
 
+    def _invalidate_caches(self) -> None:
+        """Drop registration-derived caches after the detector set changes."""
+        self._patterns_by_priority = None
+        self._break_trigger_cache = {}
+
     def get_detector(self, pattern_id: str) -> BaseDetector:
-        """Get a detector instance by pattern ID."""
-        if pattern_id not in self._detectors:
-            raise ValueError(f"No detector registered for pattern {pattern_id}")
-        return self._detectors[pattern_id]
+        """Get a detector instance by pattern ID, instantiating it on first use."""
+        detector = self._detectors.get(pattern_id)
+        if detector is None:
+            detector_class = self._detector_classes.get(pattern_id)
+            if detector_class is None:
+                raise ValueError(f"No detector registered for pattern {pattern_id}")
+            detector = self._detectors[pattern_id] = detector_class()
+        return detector
 
     def list_patterns(self) -> List[str]:
         """Return list of registered pattern IDs."""
-        return list(self._detectors.keys())
+        return list(self._detector_classes.keys())
 
     def list_alert_eligible_patterns(self) -> List[str]:
-        """Return list of pattern IDs that are alert-eligible."""
-        return [
-            pattern_id for pattern_id, detector in self._detectors.items()
-            if detector.alert_eligible
-        ]
+        """Return sorted list of pattern IDs that are alert-eligible."""
+        return sorted(self._alert_eligible)
 
     def load_rule_basis_map(self, rule_basis_path: Path) -> None:
         """
@@ -88,16 +138,16 @@ class DetectorRegistry:
             rule_basis_path: Path to xew_rule_basis_map.v1.json
         """
         try:
-            data = json.loads(rule_basis_path.read_text(encoding='utf-8'))
+            data = read_json(rule_basis_path)
 
             # Index rule basis by pattern_id for efficient lookup
-            self._rule_basis_map = {}
-            for rule in data.get('rules', []):
+            rules_by_pattern: Dict[str, List[Dict]] = defaultdict(list)
+            for rule in data.get('rules', ()):
                 pattern_id = rule.get('pattern_id')
                 if pattern_id:
-                    if pattern_id not in self._rule_basis_map:
-                        self._rule_basis_map[pattern_id] = []
-                    self._rule_basis_map[pattern_id].append(rule)
+                    rules_by_pattern[pattern_id].append(rule)
+            self._rule_basis_map = dict(rules_by_pattern)
+            self._rule_basis_valid_cache = {}
 
             self.logger.info(f"Loaded rule basis for {len(self._rule_basis_map)} patterns")
 
@@ -113,7 +163,7 @@ class DetectorRegistry:
             issue_codes_path: Path to xew_issue_codes.v1.json
         """
         try:
-            data = json.loads(issue_codes_path.read_text(encoding='utf-8'))
+            data = read_json(issue_codes_path)
 
             self._issue_codes_map = data.get('patterns', {})
             self.logger.info(f"Loaded issue codes for {len(self._issue_codes_map)} patterns")
@@ -132,65 +182,137 @@ class DetectorRegistry:
         return pattern_data.get('issue_codes', [])
 
     def run_detectors(self, context: DetectorContext,
-                     patterns: Set[str] = None) -> List[DetectorFinding]:
+                     patterns: Set[str] = None,
+                     *,
+                     parallel: bool = False,
+                     strict: bool = True) -> List[DetectorFinding]:
         """
         Run detectors and return all findings.
 
+        Detectors run serially in the calling thread by default. Arelle's
+        ModelXbrl builds and caches state lazily (e.g. relationshipSet), so
+        it is not safe to share across threads; ``parallel=True`` is opt-in
+        for contexts whose model is known to be read-only. Either way results
+        are enriched in pattern iteration order.
+
         Args:
             context: Detection context with XBRL model and metadata
             patterns: Optional set of pattern IDs to run (default: all registered)
+            parallel: Run detectors concurrently on a thread pool. Strict
+                mode then raises only after every detector has finished.
+            strict: Raise DetectorError on the first failing detector. When
+                False, failures are logged, the first MAX_RECORDED_DETECTOR_ERRORS
+                are kept in last_run_errors, and remaining detectors still run.
 
         Returns:
-            List of all findings from all detectors
+            List of all findings from all (successful) detectors
         """
+        registered = self._detector_classes
         if patterns is None:
-            patterns = set(self._detectors.keys())
-
-        findings = []
-
-        for pattern_id in patterns:
-            if pattern_id not in self._detectors:
-                self.logger.warning(f"Pattern {pattern_id} not registered, skipping")
-                continue
-
-            detector = self._detectors[pattern_id]
-
+            selected = list(registered)
+        else:
+            # Resolve unknown patterns in one set operation and a single warning;
+            # requested iteration order is preserved for the remaining patterns.
+            unknown = set(patterns).difference(registered)
+            if unknown:
+                self.logger.warning(f"Unregistered patterns, skipping: {sorted(unknown)}")
+                selected = [pattern_id for pattern_id in patterns if pattern_id not in unknown]
+            else:
+                selected = patterns
+
+        self.last_run_errors = []
+        self.last_run_error_count = 0
+
+        def fail(pattern_id: str, error: Exception) -> None:
+            self.logger.error(f"Detector {pattern_id} failed: {error}")
+            detector_error = DetectorError(pattern_id, f"Detection failed: {error}", error)
+            if strict:
+                raise detector_error
+            self.last_run_error_count += 1
+            if len(self.last_run_errors) < MAX_RECORDED_DETECTOR_ERRORS:
+                self.last_run_errors.append(detector_error)
+
+        runnable: List[Tuple[str, BaseDetector]] = []
+        for pattern_id in selected:
             try:
+                detector = self.get_detector(pattern_id)
+
                 # Check if detector should run
                 if not detector.should_run(context):
                     self.logger.debug(f"Skipping {pattern_id} (should_run returned False)")
                     continue
+            except Exception as e:
+                fail(pattern_id, e)
+                continue
+
+            runnable.append((pattern_id, detector))
+
+        if not parallel or len(runnable) <= 1:
+            # Lazy, so a strict run stops before starting the next detector.
+            outcomes = (self._run_single_detector(pattern_id, detector, context)
+                        for pattern_id, detector in runnable)
+        else:
+            max_workers = min(MAX_DETECTOR_WORKERS, len(runnable))
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="xew-detector") as executor:
+                futures = [
+                    executor.submit(self._run_single_detector, pattern_id, detector, context)
+                    for pattern_id, detector in runnable
+                ]
+                outcomes = [future.result() for future in futures]
 
-                # Run detector
-                self.logger.info(f"Running detector: {pattern_id}")
-                detector_findings = detector.detect(context)
+        findings = []
+        apply_gate = self.apply_gate_enforcement
+
+        for (pattern_id, _detector), (detector_findings, error) in zip(runnable, outcomes):
+            if error is not None:
+                fail(pattern_id, error)
+                continue
+
+            try:
+                # Pattern-level enrichment inputs, resolved once per detector
+                rule_basis = self.get_rule_basis(pattern_id)
+                selected_trigger = None
 
                 # Enrich findings with rule basis, issue codes, and break triggers
                 for finding in detector_findings:
                     if not finding.rule_basis:
-                        finding.rule_basis = self.get_rule_basis(pattern_id)
+                        finding.rule_basis = rule_basis
 
                     # Apply Gate enforcement: demote findings without valid rule basis
-                    finding = self.apply_gate_enforcement(finding, pattern_id)
+                    finding = apply_gate(finding, pattern_id)
 
-                    # Select the most specific break trigger
+                    # Select the most specific break trigger (once per pattern;
+                    # each finding gets its own copy)
                     if not finding.break_triggers:
-                        selected_trigger = self.select_break_trigger(pattern_id)
+                        if selected_trigger is None:
+                            selected_trigger = self.select_break_trigger(pattern_id)
                         if selected_trigger:
-                            finding.break_triggers = [selected_trigger]
+                            finding.break_triggers = [dict(selected_trigger)]
 
                 findings.extend(detector_findings)
                 self.logger.info(f"Detector {pattern_id} produced {len(detector_findings)} findings")
 
             except Exception as e:
-                self.logger.error(f"Detector {pattern_id} failed: {e}")
-                # In production, we might want to continue with other detectors
-                # For now, re-raise to fail fast during development
-                raise DetectorError(pattern_id, f"Detection failed: {e}", e)
+                fail(pattern_id, e)
 
+        if self.last_run_error_count:
+            self.logger.warning(f"{self.last_run_error_count} detector(s) failed; continuing without their findings")
         self.logger.info(f"All detectors completed, {len(findings)} total findings")
         return findings
 
+    def _run_single_detector(
+        self,
+        pattern_id: str,
+        detector: BaseDetector,
+        context: DetectorContext,
+    ) -> Tuple[List[DetectorFinding], Optional[Exception]]:
+        """Run one detector, returning (findings, error) instead of raising."""
+        try:
+            self.logger.info(f"Running detector: {pattern_id}")
+            return detector.detect(context), None
+        except Exception as e:
+            return [], e
+
     def select_highest_priority_finding(self, findings: List[DetectorFinding]) -> Optional[DetectorFinding]:
         """
         Select the highest priority finding for external alerts.
@@ -208,28 +330,39 @@ class DetectorRegistry:
         if not findings:
             return None
 
-        # Filter to alert-eligible findings only
-        alert_eligible_findings = [f for f in findings if f.alert_eligible]
+        # Single pass over alert-eligible findings, no filtered copy or sort.
+        # Key: (priority, pattern_id, finding_id); lower number = higher priority,
+        # UNKNOWN_PATTERN_PRIORITY for unknown patterns. Priorities are resolved
+        # once per pattern.
+        priorities: Dict[str, int] = {}
+        priority_of = PATTERN_PRIORITIES.get
+        selected_finding: Optional[DetectorFinding] = None
+        best_key: Optional[Tuple[int, str, str]] = None
+        eligible_count = 0
 
-        if not alert_eligible_findings:
+        for finding in findings:
+            if not finding.alert_eligible:
+                continue
+            eligible_count += 1
+            pattern_id = finding.pattern_id
+            priority = priorities.get(pattern_id)
+            if priority is None:
+                priority = priorities[pattern_id] = priority_of(pattern_id, UNKNOWN_PATTERN_PRIORITY)
+            # Cheap reject before building the full tie-break tuple.
+            if best_key is not None and priority > best_key[0]:
+                continue
+            key = (priority, pattern_id, finding.finding_id)
+            if best_key is None or key < best_key:
+                best_key = key
+                selected_finding = finding
+
+        if selected_finding is None:
             self.logger.info("No alert-eligible findings for priority selection")
             return None
 
-        self.logger.debug(f"Selecting priority from {len(alert_eligible_findings)} alert-eligible findings")
-
-        # Sort by pattern priority (lower number = higher priority)
-        def get_priority(finding: DetectorFinding) -> int:
-            return PATTERN_PRIORITIES.get(finding.pattern_id, 999)  # 999 for unknown patterns
-
-        # Deterministic tie-breakers for equal priority
-        def sort_key(finding: DetectorFinding) -> tuple[int, str, str]:
-            return (get_priority(finding), finding.pattern_id, finding.finding_id)
-
-        prioritized_findings = sorted(alert_eligible_findings, key=sort_key)
-        selected_finding = prioritized_findings[0]
-
+        self.logger.debug(f"Selected priority from {eligible_count} alert-eligible findings")
         self.logger.info(f"Selected highest priority finding: {selected_finding.pattern_id} "
-                        f"(priority {get_priority(selected_finding)}) from {len(findings)} total findings")
+                        f"(priority {best_key[0]}) from {len(findings)} total findings")
 
         return selected_finding
 
@@ -243,7 +376,7 @@ class DetectorRegistry:
         Returns:
             Priority level (lower number = higher priority)
         """
-        return PATTERN_PRIORITIES.get(pattern_id, 999)
+        return PATTERN_PRIORITIES.get(pattern_id, UNKNOWN_PATTERN_PRIORITY)
 
     def run_detectors_with_priority_selection(self, context: DetectorContext,
                                             patterns: Set[str] = None) -> Tuple[List[DetectorFinding], Optional[DetectorFinding]]:
@@ -315,16 +448,12 @@ class DetectorRegistry:
         Returns:
             List of pattern IDs sorted by priority level
         """
-        registered_patterns = self.list_patterns()
-
-        # Sort by priority level
-        def get_priority(pattern_id: str) -> int:
-            return PATTERN_PRIORITIES.get(pattern_id, 999)
+        if self._patterns_by_priority is None:
+            # Sort by priority level (computed once per registration change)
+            self._patterns_by_priority = sorted(self.list_patterns(), key=self.get_pattern_priority)
+            self.logger.debug(f"Patterns by priority: {self._patterns_by_priority}")
 
-        prioritized_patterns = sorted(registered_patterns, key=get_priority)
-
-        self.logger.debug(f"Patterns by priority: {prioritized_patterns}")
-        return prioritized_patterns
+        return list(self._patterns_by_priority)
 
     def select_break_trigger(self, pattern_id: str) -> Dict[str, str]:
         """
@@ -339,26 +468,31 @@ class DetectorRegistry:
         Returns:
             Single break trigger dict with 'id' and 'summary', or empty dict if none available
         """
-        if pattern_id not in self._detectors:
+        if pattern_id not in self._detector_classes:
             return {}
 
-        detector = self._detectors[pattern_id]
+        # Break triggers are pattern-level; select once per registered detector
+        # and cache a read-only view, handing each caller its own dict.
+        cached = self._break_trigger_cache.get(pattern_id)
+        if cached is not None:
+            return dict(cached)
 
         try:
-            available_triggers = detector.get_break_triggers()
+            available_triggers = self.get_detector(pattern_id).get_break_triggers()
 
             if not available_triggers:
                 self.logger.warning(f"No break triggers available for {pattern_id}")
+                self._break_trigger_cache[pattern_id] = MappingProxyType({})
                 return {}
 
-            # Sort by trigger ID for deterministic selection
-            # Lower numbers are more specific (BT001 > BT002 > BT003 > BT004)
-            sorted_triggers = sorted(available_triggers, key=lambda t: t.get('id', 'ZZZ'))
-
-            selected = sorted_triggers[0]
+            # Lowest trigger ID wins for deterministic selection (first on ties,
+            # as with a stable sort). Lower numbers are more specific
+            # (BT001 > BT002 > BT003 > BT004)
+            selected = min(available_triggers, key=_break_trigger_sort_key)
             self.logger.debug(f"Selected break trigger for {pattern_id}: {selected.get('id')}")
 
-            return selected
+            self._break_trigger_cache[pattern_id] = MappingProxyType(dict(selected))
+            return dict(selected)
 
         except Exception as e:
             self.logger.error(f"Failed to select break trigger for {pattern_id}: {e}")
@@ -398,7 +532,8 @@ class DetectorRegistry:
                 finding.human_review_required = True
 
                 self.logger.info(f"Finding {finding.finding_id} demoted by Gate enforcement")
-            else:
+            elif self.logger.isEnabledFor(logging.DEBUG):
+                # Per-finding path: skip building the message unless it is emitted
                 self.logger.debug(f"Finding {finding.finding_id} passed Gate enforcement")
 
             return finding
@@ -428,6 +563,14 @@ class DetectorRegistry:
                 self.logger.debug(f"No rule basis found for {pattern_id}")
                 return False
 
+            # Findings enriched from the registry share the pattern's rule list;
+            # validate that list once per pattern rather than once per finding.
+            shared = finding.rule_basis is self._rule_basis_map.get(pattern_id)
+            if shared:
+                cached = self._rule_basis_valid_cache.get(pattern_id)
+                if cached is not None:
+                    return cached
+
             # Validate each citation
             valid_citations = 0
             for citation in finding.rule_basis:
@@ -436,10 +579,13 @@ class DetectorRegistry:
 
             if valid_citations == 0:
                 self.logger.debug(f"No valid citations found for {pattern_id}")
-                return False
+            else:
+                self.logger.debug(f"Found {valid_citations} valid citations for {pattern_id}")
 
-            self.logger.debug(f"Found {valid_citations} valid citations for {pattern_id}")
-            return True
+            is_valid = valid_citations > 0
+            if shared:
+                self._rule_basis_valid_cache[pattern_id] = is_valid
+            return is_valid
 
         except Exception as e:
             self.logger.warning(f"Error validating rule basis for {pattern_id}: {e}")
@@ -478,7 +624,7 @@ class DetectorRegistry:
 
             # Validate sha256 format (64 hex characters)
             sha256 = citation['sha256']
-            if len(sha256) != 64 or not all(c in '0123456789abcdefABCDEF' for c in sha256):
+            if not _SHA256_HEX_RE.match(sha256):
                 self.logger.debug(f"Invalid sha256 format: {sha256}")
                 return False
 
@@ -505,31 +651,15 @@ class DetectorRegistry:
             package_path: Package path to scan for detectors
         """
         try:
-            # Import the package to get its path
-            package = importlib.import_module(package_path)
-            package_dir = Path(package.__file__).parent
-
-            # Look for detector modules (p001_*.py, p002_*.py, etc.)
-            detector_modules = []
-            # Pattern detectors: p001, p002, etc.
-            for module_file in package_dir.glob("p[0-9][0-9][0-9]_*.py"):
-                module_name = module_file.stem
-                full_module_name = f"{package_path}.{module_name}"
-                detector_modules.append(full_module_name)
+            detector_modules = self._discover_detector_modules(package_path)
 
             # Import modules and register detectors
             for module_name in detector_modules:
                 try:
                     module = importlib.import_module(module_name)
-
-                    # Look for detector classes (subclasses of BaseDetector)
-                    for attr_name in dir(module):
-                        attr = getattr(module, attr_name)
-                        if (isinstance(attr, type) and
-                            issubclass(attr, BaseDetector) and
-                            attr != BaseDetector):
-                            self.register(attr)
-                            break  # Only register one detector per module
+                    detector_class = _find_detector_class(module)
+                    if detector_class is not None:
+                        self.register(detector_class)
 
                 except Exception as e:
                     self.logger.warning(f"Failed to import detector module {module_name}: {e}")
@@ -539,6 +669,58 @@ class DetectorRegistry:
         except Exception as e:
             self.logger.error(f"Auto-discovery failed: {e}")
 
+    def _discover_detector_modules(self, package_path: str) -> List[str]:
+        """Return sorted detector module names in a package, scanning it once per registry."""
+        cached = self._discovery_cache.get(package_path)
+        if cached is not None:
+            return cached
+
+        detector_modules = sorted(
+            f"{package_path}.{entry.name[:-3]}"
+            for entry in resources.files(package_path).iterdir()
+            if _DETECTOR_MODULE_RE.match(entry.name)
+        )
+        self._discovery_cache[package_path] = detector_modules
+        return detector_modules
+
+
+def _class_metadata(detector_class: Type[BaseDetector]) -> Optional[Tuple[str, bool]]:
+    """Return (pattern_id, alert_eligible) if declared as class attributes, else None."""
+    pattern_id = getattr(detector_class, "pattern_id", None)
+    alert_eligible = getattr(detector_class, "alert_eligible", None)
+    if isinstance(pattern_id, str) and isinstance(alert_eligible, bool):
+        return pattern_id, alert_eligible
+    return None
+
+
+def _break_trigger_sort_key(trigger: Dict[str, str]) -> str:
+    """Sort key for break triggers; triggers without an ID sort last."""
+    return trigger.get('id', 'ZZZ')
+
+
+def _find_detector_class(module: Any) -> Optional[Type[BaseDetector]]:
+    """Return the detector class a module exposes.
+
+    Detector modules declare it as DETECTOR_CLS; for modules without one the
+    first concrete BaseDetector subclass defined in the module is used, found
+    through the interpreter-maintained subclass lists rather than scanning the
+    module namespace.
+    """
+    detector_class = getattr(module, "DETECTOR_CLS", None)
+    if isinstance(detector_class, type) and issubclass(detector_class, BaseDetector):
+        return detector_class
+    if detector_class is not None:
+        logger.warning(f"Ignoring DETECTOR_CLS in {module.__name__}: not a BaseDetector subclass")
+
+    module_name = module.__name__
+    pending = deque(BaseDetector.__subclasses__())
+    while pending:
+        cls = pending.popleft()
+        if cls.__module__ == module_name and not inspect.isabstract(cls):
+            return cls
+        pending.extend(cls.__subclasses__())
+    return None
+
 
 # Global registry instance
 _registry = DetectorRegistry()
@@ -551,9 +733,10 @@ def register_detector(detector_class: Type[BaseDetector]) -> None:
     """Register a detector class with the global registry."""
     _registry.register(detector_class)
 
-def run_detectors(context: DetectorContext, patterns: Set[str] = None) -> List[DetectorFinding]:
+def run_detectors(context: DetectorContext, patterns: Set[str] = None, *,
+                  parallel: bool = False, strict: bool = True) -> List[DetectorFinding]:
     """Run detectors using the global registry."""
-    return _registry.run_detectors(context, patterns)
+    return _registry.run_detectors(context, patterns, parallel=parallel, strict=strict)
 
 def run_detectors_with_priority_selection(context: DetectorContext, patterns: Set[str] = None) -> Tuple[List[DetectorFinding], Optional[DetectorFinding]]:
     """Run detectors with priority selection using the global registry."""
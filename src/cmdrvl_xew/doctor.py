@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import tempfile
 from dataclasses import dataclass
@@ -9,6 +8,7 @@ from pathlib import Path
 
 from .exit_codes import ExitCode
 from .toolchain import detect_arelle_version
+from .util import read_json
 
 
 @dataclass(frozen=True)
@@ -19,18 +19,35 @@ class DoctorCheck:
     fix: str | None = None
 
 
+# Environment variables consulted by doctor, read once per run.
+_DOCTOR_ENV_KEYS = (
+    "XEW_ARELLE_BUNDLE_URI",
+    "XEW_ARELLE_BUNDLE_SHA256",
+    "AWS_PROFILE",
+    "XEW_USER_AGENT",
+    "XEW_ARELLE_XDG_CONFIG_HOME",
+)
+
+
+def _read_doctor_env() -> dict[str, str]:
+    """Snapshot the doctor environment variables, stripped ('' when unset)."""
+    environ = os.environ
+    return {key: (environ.get(key) or "").strip() for key in _DOCTOR_ENV_KEYS}
+
+
 def run_doctor(args: argparse.Namespace) -> int:
     """Check local environment configuration for deterministic `pack` runs."""
     checks: list[DoctorCheck] = []
+    env = _read_doctor_env()
 
-    xdg_home = _resolve_arelle_xdg_config_home(getattr(args, "arelle_xdg_config_home", None))
+    xdg_home = _resolve_arelle_xdg_config_home(getattr(args, "arelle_xdg_config_home", None), env)
     registry_path = xdg_home / "arelle" / "taxonomyPackages.json"
 
-    checks.extend(_check_arelle_importable())
-    checks.extend(_check_xdg_config_home_writable(xdg_home))
-    checks.extend(_check_taxonomy_registry(registry_path))
-    checks.extend(_check_bundle_env())
-    checks.extend(_check_user_agent_env())
+    checks.append(_check_arelle_importable())
+    checks.append(_check_xdg_config_home_writable(xdg_home))
+    checks.append(_check_taxonomy_registry(registry_path))
+    checks.append(_check_bundle_env(env))
+    checks.append(_check_user_agent_env(env))
 
     _print_checks(checks, xdg_home=xdg_home, registry_path=registry_path)
 
@@ -40,149 +57,129 @@ def run_doctor(args: argparse.Namespace) -> int:
     return ExitCode.CONFIG_ERROR if has_fail else ExitCode.SUCCESS
 
 
-def _resolve_arelle_xdg_config_home(cli_value: str | None) -> Path:
-    configured = (cli_value or os.environ.get("XEW_ARELLE_XDG_CONFIG_HOME") or "").strip()
+def _resolve_arelle_xdg_config_home(cli_value: str | None, env: dict[str, str]) -> Path:
+    configured = (cli_value or env["XEW_ARELLE_XDG_CONFIG_HOME"]).strip()
     if configured:
         return Path(configured).expanduser().resolve()
     return Path(tempfile.gettempdir()) / "cmdrvl-xew-arelle"
 
 
-def _check_arelle_importable() -> list[DoctorCheck]:
+def _check_arelle_importable() -> DoctorCheck:
     version = detect_arelle_version()
     if version != "not_installed":
-        return [DoctorCheck("arelle", "OK", f"import ok (version={version})")]
+        return DoctorCheck("arelle", "OK", f"import ok (version={version})")
 
     try:
         import arelle  # noqa: F401  # type: ignore
     except Exception as e:
-        return [
-            DoctorCheck(
-                "arelle",
-                "FAIL",
-                f"cannot import ({e})",
-                fix="Install the production extra: pip install 'cmdrvl-xew[arelle]' or uv sync --extra arelle.",
-            )
-        ]
+        return DoctorCheck(
+            "arelle",
+            "FAIL",
+            f"cannot import ({e})",
+            fix="Install the production extra: pip install 'cmdrvl-xew[arelle]' or uv sync --extra arelle.",
+        )
+    return DoctorCheck("arelle", "OK", "import ok (version=unknown)")
 
 
-def _check_xdg_config_home_writable(xdg_home: Path) -> list[DoctorCheck]:
+def _check_xdg_config_home_writable(xdg_home: Path) -> DoctorCheck:
     try:
         xdg_home.mkdir(parents=True, exist_ok=True)
     except Exception as e:
-        return [
-            DoctorCheck(
-                "arelle_xdg_config_home",
-                "FAIL",
-                f"not writable: {xdg_home} ({e})",
-                fix="Choose a writable path and pass --arelle-xdg-config-home, or set XEW_ARELLE_XDG_CONFIG_HOME.",
-            )
-        ]
-    return [DoctorCheck("arelle_xdg_config_home", "OK", f"{xdg_home}")]
-
-
-def _check_taxonomy_registry(registry_path: Path) -> list[DoctorCheck]:
-    if not registry_path.exists():
-        return [
-            DoctorCheck(
-                "taxonomy_packages",
-                "FAIL",
-                f"missing registry: {registry_path}",
-                fix=(
-                    "Run: cmdrvl-xew arelle install-packages --arelle-xdg-config-home <DIR>\n"
-                    "Then run packs with the same --arelle-xdg-config-home and --resolution-mode offline_only."
-                ),
-            )
-        ]
+        return DoctorCheck(
+            "arelle_xdg_config_home",
+            "FAIL",
+            f"not writable: {xdg_home} ({e})",
+            fix="Choose a writable path and pass --arelle-xdg-config-home, or set XEW_ARELLE_XDG_CONFIG_HOME.",
+        )
+    return DoctorCheck("arelle_xdg_config_home", "OK", f"{xdg_home}")
+
 
+def _check_taxonomy_registry(registry_path: Path) -> DoctorCheck:
     try:
-        data = json.loads(registry_path.read_text(encoding="utf-8"))
+        data = read_json(registry_path)
+    except FileNotFoundError:
+        return DoctorCheck(
+            "taxonomy_packages",
+            "FAIL",
+            f"missing registry: {registry_path}",
+            fix=(
+                "Run: cmdrvl-xew arelle install-packages --arelle-xdg-config-home <DIR>\n"
+                "Then run packs with the same --arelle-xdg-config-home and --resolution-mode offline_only."
+            ),
+        )
     except Exception as e:
-        return [
-            DoctorCheck(
-                "taxonomy_packages",
-                "FAIL",
-                f"invalid registry JSON: {registry_path} ({e})",
-                fix="Re-run: cmdrvl-xew arelle install-packages --arelle-xdg-config-home <DIR> --force",
-            )
-        ]
+        return DoctorCheck(
+            "taxonomy_packages",
+            "FAIL",
+            f"invalid registry JSON: {registry_path} ({e})",
+            fix="Re-run: cmdrvl-xew arelle install-packages --arelle-xdg-config-home <DIR> --force",
+        )
 
     packages = data.get("packages")
     if not isinstance(packages, list) or not packages:
-        return [
-            DoctorCheck(
-                "taxonomy_packages",
-                "FAIL",
-                f"registry has no packages: {registry_path}",
-                fix="Re-run: cmdrvl-xew arelle install-packages --arelle-xdg-config-home <DIR>",
-            )
-        ]
+        return DoctorCheck(
+            "taxonomy_packages",
+            "FAIL",
+            f"registry has no packages: {registry_path}",
+            fix="Re-run: cmdrvl-xew arelle install-packages --arelle-xdg-config-home <DIR>",
+        )
 
-    return [DoctorCheck("taxonomy_packages", "OK", f"{len(packages)} package(s) installed")]
+    return DoctorCheck("taxonomy_packages", "OK", f"{len(packages)} package(s) installed")
 
 
-def _check_bundle_env() -> list[DoctorCheck]:
-    uri = (os.environ.get("XEW_ARELLE_BUNDLE_URI") or "").strip()
+def _check_bundle_env(env: dict[str, str]) -> DoctorCheck:
+    uri = env["XEW_ARELLE_BUNDLE_URI"]
     if not uri:
-        return [
-            DoctorCheck(
-                "bundle_uri",
-                "WARN",
-                "XEW_ARELLE_BUNDLE_URI not set",
-                fix="Optional: set XEW_ARELLE_BUNDLE_URI (s3://, http(s)://, file://, or local path) for easy bootstrap.",
-            )
-        ]
-
-    sha = (os.environ.get("XEW_ARELLE_BUNDLE_SHA256") or "").strip()
+        return DoctorCheck(
+            "bundle_uri",
+            "WARN",
+            "XEW_ARELLE_BUNDLE_URI not set",
+            fix="Optional: set XEW_ARELLE_BUNDLE_URI (s3://, http(s)://, file://, or local path) for easy bootstrap.",
+        )
+
+    sha = env["XEW_ARELLE_BUNDLE_SHA256"]
     if not sha:
-        return [
-            DoctorCheck(
-                "bundle_uri",
-                "WARN",
-                f"set: {uri} (no XEW_ARELLE_BUNDLE_SHA256)",
-                fix="Recommended: set XEW_ARELLE_BUNDLE_SHA256 to pin bundle integrity.",
-            )
-        ]
-
-    profile = (os.environ.get("AWS_PROFILE") or "").strip()
+        return DoctorCheck(
+            "bundle_uri",
+            "WARN",
+            f"set: {uri} (no XEW_ARELLE_BUNDLE_SHA256)",
+            fix="Recommended: set XEW_ARELLE_BUNDLE_SHA256 to pin bundle integrity.",
+        )
+
+    profile = env["AWS_PROFILE"]
     if uri.startswith("s3://") and not profile:
-        return [
-            DoctorCheck(
-                "bundle_uri",
-                "WARN",
-                f"set: {uri} (AWS_PROFILE not set)",
-                fix="If using S3 bundle URIs, set AWS_PROFILE or configure IAM role credentials.",
-            )
-        ]
+        return DoctorCheck(
+            "bundle_uri",
+            "WARN",
+            f"set: {uri} (AWS_PROFILE not set)",
+            fix="If using S3 bundle URIs, set AWS_PROFILE or configure IAM role credentials.",
+        )
 
-    return [DoctorCheck("bundle_uri", "OK", f"set: {uri}")]
+    return DoctorCheck("bundle_uri", "OK", f"set: {uri}")
 
 
-def _check_user_agent_env() -> list[DoctorCheck]:
-    user_agent = (os.environ.get("XEW_USER_AGENT") or "").strip()
+def _check_user_agent_env(env: dict[str, str]) -> DoctorCheck:
+    user_agent = env["XEW_USER_AGENT"]
     if not user_agent:
-        return [
-            DoctorCheck(
-                "user_agent",
-                "WARN",
-                "XEW_USER_AGENT not set",
-                fix="Required for `cmdrvl-xew fetch` and any online taxonomy resolution.",
-            )
-        ]
+        return DoctorCheck(
+            "user_agent",
+            "WARN",
+            "XEW_USER_AGENT not set",
+            fix="Required for `cmdrvl-xew fetch` and any online taxonomy resolution.",
+        )
 
     try:
         from .edgar_fetch import _validate_user_agent  # type: ignore
 
         _validate_user_agent(user_agent)
-        return [DoctorCheck("user_agent", "OK", "set (SEC-compliant)")]
+        return DoctorCheck("user_agent", "OK", "set (SEC-compliant)")
     except Exception as e:
-        return [
-            DoctorCheck(
-                "user_agent",
-                "WARN",
-                f"set but invalid: {e}",
-                fix="Set XEW_USER_AGENT to a descriptive value with contact info (email/URL/phone).",
-            )
-        ]
+        return DoctorCheck(
+            "user_agent",
+            "WARN",
+            f"set but invalid: {e}",
+            fix="Set XEW_USER_AGENT to a descriptive value with contact info (email/URL/phone).",
+        )
 
 
 def _print_checks(checks: list[DoctorCheck], *, xdg_home: Path, registry_path: Path) -> None:
@@ -1,23 +1,45 @@
 from __future__ import annotations
 
-import json
+import gzip
+import http.client
+import io
+import math
+import os
+import re
+import shutil
+import threading
 import time
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin, urlsplit
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Iterable, Optional, Dict, List, Tuple
+from typing import BinaryIO, Iterable, Iterator, Optional, Dict, List, Tuple
+
+from .util import loads_json
 
 _DEFAULT_MIN_INTERVAL_SECONDS = 0.2
+# Concurrent artifact downloads; the shared rate limiter still caps requests/second.
+_DEFAULT_DOWNLOAD_WORKERS = 4
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+_MAX_REDIRECTS = 5
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
 
 _EXHIBIT_PREFIXES = ("ex",)
 _PRIMARY_HTML_SUFFIXES = (".htm", ".html")
 _LINKBASE_SUFFIXES = ("_cal.xml", "_def.xml", "_lab.xml", "_pre.xml")
 _USER_AGENT_MIN_LEN = 8
 _USER_AGENT_CONTACT_TOKENS = ("@", "http://", "https://", "mailto:", "tel:")
+_INDEX_PAGE_NAMES = frozenset({"index.html", "index.htm"})
+# Directory listing links, matched exactly as EDGAR emits them: <a href="NAME">
+_INDEX_HREF_RE = re.compile(r'<a href="([^"]*)"')
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EdgarDirectoryItem:
     name: str
     type: str | None = None
@@ -25,66 +47,243 @@ class EdgarDirectoryItem:
     last_modified: str | None = None
 
 
-@dataclass
-class RateLimiter:
-    min_interval_seconds: float = _DEFAULT_MIN_INTERVAL_SECONDS
-    _last_request: float = 0.0
+class TokenBucket:
+    """Thread-safe token bucket rate limiter shared by concurrent requests.
+
+    Holds up to ``capacity`` tokens, refilled at ``rate`` tokens per second;
+    each ``wait`` takes one token, sleeping (outside the lock) until it is due.
+    """
+
+    def __init__(self, capacity: float, rate: float) -> None:
+        if capacity < 1 or rate <= 0:
+            raise ValueError("capacity must be >= 1 and rate must be positive")
+        self.capacity = float(capacity)
+        self.rate = float(rate)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
 
     def wait(self) -> None:
-        """Sleep as needed to enforce a minimum interval between requests."""
-        now = time.monotonic()
-        elapsed = now - self._last_request
-        if elapsed < self.min_interval_seconds:
-            time.sleep(self.min_interval_seconds - elapsed)
-        self._last_request = time.monotonic()
+        """Block until a request may be sent."""
+        if self.rate == math.inf:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            # Reserve the token now; a negative balance queues later callers behind us.
+            self._tokens -= 1.0
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if delay > 0:
+            time.sleep(delay)
+
+
+class RateLimiter(TokenBucket):
+    """Fixed-spacing limiter: requests start at least ``min_interval_seconds`` apart.
+
+    A capacity-1 TokenBucket (no bursts), so it is thread-safe and can be
+    shared by concurrent downloads; ``min_interval_seconds <= 0`` disables it.
+    """
+
+    def __init__(self, min_interval_seconds: float = _DEFAULT_MIN_INTERVAL_SECONDS) -> None:
+        self.min_interval_seconds = min_interval_seconds
+        rate = 1.0 / min_interval_seconds if min_interval_seconds > 0 else math.inf
+        super().__init__(capacity=1, rate=rate)
+
+
+class EdgarSession:
+    """Persistent keep-alive connections reused across EDGAR requests.
+
+    urlopen opens a fresh TCP + TLS connection for every URL; a session keeps
+    one HTTP/1.1 connection per host, so the index and all artifacts of an
+    accession share a single handshake. Requests through a configured proxy
+    fall back to urlopen. Not thread-safe: use one session per thread.
+    """
+
+    def __init__(self, *, timeout: float | None = None) -> None:
+        self.timeout = timeout
+        self._connections: dict[tuple[str, str], http.client.HTTPConnection] = {}
+
+    def __enter__(self) -> "EdgarSession":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        for conn in self._connections.values():
+            conn.close()
+        self._connections.clear()
+
+    @contextmanager
+    def open(self, url: str, *, headers: Dict[str, str]) -> Iterator[BinaryIO]:
+        """GET a URL, following redirects, and yield the (decoded) response body.
+
+        Raises HTTPError for error statuses and URLError for connection
+        failures, like urlopen. A response that is not read to the end is
+        discarded together with its connection.
+        """
+        # EDGAR HTML/JSON/XML compresses several-fold; bodies are decoded transparently.
+        headers = {"Accept-Encoding": "gzip", **headers}
+        for _ in range(_MAX_REDIRECTS + 1):
+            # Checked per hop: a redirect may lead to a host that must be proxied.
+            if _uses_proxy(*_split_origin(url)):
+                req = urllib.request.Request(url, headers=headers)
+                with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+                    yield _decoded_body(resp)
+                return
+            resp = self._request(url, headers)
+            if resp.status in _REDIRECT_STATUSES and resp.getheader("Location"):
+                resp.read()
+                url = urljoin(url, resp.getheader("Location"))
+                continue
+            if resp.status >= 300:
+                body = resp.read()
+                raise HTTPError(url, resp.status, resp.reason, resp.headers, io.BytesIO(body))
+            break
+        else:
+            raise HTTPError(url, resp.status, "too many redirects", resp.headers, None)
+
+        try:
+            yield _decoded_body(resp)
+        finally:
+            if not resp.isclosed():
+                # Unread body bytes would corrupt the next response on this connection.
+                self._discard(_split_origin(url))
+
+    def _request(self, url: str, headers: Dict[str, str]) -> http.client.HTTPResponse:
+        origin = _split_origin(url)
+        parts = urlsplit(url)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+
+        conn = self._connections.get(origin)
+        if conn is not None:
+            try:
+                conn.request("GET", target, headers=headers)
+                return conn.getresponse()
+            except (http.client.HTTPException, OSError):
+                # The server may have closed the idle connection; retry on a fresh one.
+                self._discard(origin)
+
+        conn = self._connection(origin)
+        try:
+            conn.request("GET", target, headers=headers)
+            return conn.getresponse()
+        except (http.client.HTTPException, OSError) as e:
+            self._discard(origin)
+            raise URLError(e) from e
+
+    def _connection(self, origin: tuple[str, str]) -> http.client.HTTPConnection:
+        conn = self._connections.get(origin)
+        if conn is None:
+            scheme, netloc = origin
+            kwargs = {} if self.timeout is None else {"timeout": self.timeout}
+            if scheme == "https":
+                conn = http.client.HTTPSConnection(netloc, **kwargs)
+            else:
+                conn = http.client.HTTPConnection(netloc, **kwargs)
+            self._connections[origin] = conn
+        return conn
+
+    def _discard(self, origin: tuple[str, str]) -> None:
+        conn = self._connections.pop(origin, None)
+        if conn is not None:
+            conn.close()
+
+
+def _decoded_body(resp: http.client.HTTPResponse) -> BinaryIO:
+    """Readable body of a response, gunzipped if it is gzip content-encoded."""
+    encoding = (resp.headers.get("Content-Encoding") or "").strip().lower()
+    if encoding == "gzip":
+        return gzip.GzipFile(fileobj=resp, mode="rb")
+    return resp
+
+
+def _split_origin(url: str) -> tuple[str, str]:
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        raise URLError(f"unsupported URL: {url}")
+    return parts.scheme, parts.netloc
+
+
+def _uses_proxy(scheme: str, netloc: str) -> bool:
+    proxies = urllib.request.getproxies()
+    if scheme not in proxies:
+        return False
+    return not urllib.request.proxy_bypass(netloc)
 
 
+# Pure string helpers below are memoized: batch runs resolve the same accessions repeatedly.
+@lru_cache(maxsize=4096)
 def accession_no_dashes(accession: str) -> str:
     return accession.replace("-", "")
 
 
+@lru_cache(maxsize=4096)
 def cik_dirname(cik: str) -> str:
     return str(int(cik))
 
 
+@lru_cache(maxsize=4096)
 def accession_base_url(cik: str, accession: str) -> str:
     # SEC EDGAR Archives are hosted under www.sec.gov.
     # Note: data.sec.gov does not serve the /Archives/ tree.
     return f"https://www.sec.gov/Archives/edgar/data/{cik_dirname(cik)}/{accession_no_dashes(accession)}"
 
 
-def fetch_accession_items(cik: str, accession: str, *, user_agent: str) -> list[EdgarDirectoryItem]:
-    """Fetch EDGAR index (JSON/HTML) for an accession with SEC-compliant headers."""
+def fetch_accession_items(
+    cik: str,
+    accession: str,
+    *,
+    user_agent: str,
+    session: EdgarSession | None = None,
+) -> list[EdgarDirectoryItem]:
+    """Fetch EDGAR index (JSON/HTML) for an accession with SEC-compliant headers.
+
+    Pass a shared ``session`` to reuse its connection for the artifact downloads.
+    """
     _validate_user_agent(user_agent)
     limiter = RateLimiter()
     base = accession_base_url(cik, accession)
     json_url = f"{base}/index.json"
     html_url = f"{base}/index.html"
-    try:
-        text = _fetch_text(json_url, user_agent=user_agent, rate_limiter=limiter)
-        return parse_index_json(text)
-    except (HTTPError, URLError, ValueError):
-        text = _fetch_text(html_url, user_agent=user_agent, rate_limiter=limiter)
-        return parse_index_html(text)
+    with _session_scope(session) as session:
+        try:
+            text = _fetch_text(json_url, user_agent=user_agent, rate_limiter=limiter, session=session)
+            return parse_index_json(text)
+        except (HTTPError, ValueError) as e:
+            # Only a missing or unparseable index.json falls back to index.html;
+            # throttling, server and connection errors would hit it the same way.
+            if isinstance(e, HTTPError) and e.code != 404:
+                raise
+            text = _fetch_text(html_url, user_agent=user_agent, rate_limiter=limiter, session=session)
+            return parse_index_html(text)
 
 
 def parse_index_json(text: str) -> list[EdgarDirectoryItem]:
-    data = json.loads(text)
+    data = loads_json(text)
     directory = data.get("directory") or {}
     items = directory.get("item") or []
     parsed: list[EdgarDirectoryItem] = []
+    append = parsed.append
+    make_item = EdgarDirectoryItem
+    coerce_int = _coerce_int
     for item in items:
         if not isinstance(item, dict):
             continue
-        name = str(item.get("name", "")).strip()
+        get = item.get
+        name = str(get("name", "")).strip()
         if not name:
             continue
-        parsed.append(
-            EdgarDirectoryItem(
+        append(
+            make_item(
                 name=name,
-                type=item.get("type"),
-                size=_coerce_int(item.get("size")),
-                last_modified=item.get("last-modified") or item.get("last_modified"),
+                type=get("type"),
+                size=coerce_int(get("size")),
+                last_modified=get("last-modified") or get("last_modified"),
             )
         )
     return parsed
@@ -92,74 +291,70 @@ def parse_index_json(text: str) -> list[EdgarDirectoryItem]:
 
 def parse_index_html(text: str) -> list[EdgarDirectoryItem]:
     items: list[EdgarDirectoryItem] = []
-    start = 0
-    needle = "<a href=\""
-    while True:
-        idx = text.find(needle, start)
-        if idx == -1:
-            break
-        name_start = idx + len(needle)
-        name_end = text.find("\"", name_start)
-        if name_end == -1:
-            break
-        name = text[name_start:name_end]
-        start = name_end + 1
+    for name in _INDEX_HREF_RE.findall(text):
         lower = name.lower()
-        if name == "../" or lower.startswith("parent"):
-            continue
-        if lower in ("index.html", "index.htm"):
+        if name == "../" or lower.startswith("parent") or lower in _INDEX_PAGE_NAMES:
             continue
         items.append(EdgarDirectoryItem(name=name))
     return items
 
 
 def select_primary_html(items: Iterable[EdgarDirectoryItem]) -> EdgarDirectoryItem | None:
-    items_list = list(items)
-    xsd_stems = {Path(item.name).stem for item in items_list if item.name.lower().endswith(".xsd")}
-
-    candidates: list[EdgarDirectoryItem] = []
-    for item in items_list:
-        name_lower = item.name.lower()
-        if not name_lower.endswith(_PRIMARY_HTML_SUFFIXES):
-            continue
-        if "-index" in name_lower or name_lower in ("index.html", "index.htm"):
-            continue
-        if name_lower.startswith(_EXHIBIT_PREFIXES):
-            continue
-        candidates.append(item)
-    if not candidates:
-        return None
-
-    def _sort_key(item: EdgarDirectoryItem) -> tuple[int, int, int, str]:
-        stem = Path(item.name).stem
-        matches_xsd = 0 if stem in xsd_stems else 1
-        looks_like_report = 1 if _looks_like_sec_report_page(item.name) else 0
-        size = item.size if item.size is not None else -1
-        # Prefer an HTML whose basename matches the .xsd; avoid SEC-rendered report pages (R1.htm, etc.);
-        # then prefer largest; tie-break by name for determinism.
-        return (matches_xsd, looks_like_report, -size, item.name)
-
-    candidates.sort(key=_sort_key)
-    return candidates[0]
+    return _partition_accession_items(items)[0]
 
 
 def select_extension_artifacts(items: Iterable[EdgarDirectoryItem]) -> list[EdgarDirectoryItem]:
-    selected: list[EdgarDirectoryItem] = []
-    for item in items:
-        name_lower = item.name.lower()
-        if name_lower.endswith(".xsd"):
-            selected.append(item)
-        elif name_lower.endswith(_LINKBASE_SUFFIXES):
-            selected.append(item)
-    selected.sort(key=lambda item: item.name)
-    return selected
+    return _partition_accession_items(items)[1]
 
 
 def collect_accession_artifacts(items: Iterable[EdgarDirectoryItem]) -> tuple[EdgarDirectoryItem, list[EdgarDirectoryItem]]:
-    primary = select_primary_html(items)
+    primary, extensions = _partition_accession_items(items)
     if primary is None:
         raise ValueError("primary HTML not found in accession directory listing")
-    extensions = select_extension_artifacts(items)
+    return primary, extensions
+
+
+def _partition_accession_items(
+    items: Iterable[EdgarDirectoryItem],
+) -> tuple[EdgarDirectoryItem | None, list[EdgarDirectoryItem]]:
+    """Pick the primary HTML and the extension artifacts in one pass over ``items``.
+
+    Each name is lower-cased once and checked against both selections.
+    """
+    xsd_stems: set[str] = set()
+    html: list[tuple[int, EdgarDirectoryItem]] = []
+    extensions: list[EdgarDirectoryItem] = []
+    for index, item in enumerate(items):
+        name_lower = item.name.lower()
+        if name_lower.endswith(".xsd"):
+            xsd_stems.add(Path(item.name).stem)
+            extensions.append(item)
+        elif name_lower.endswith(_LINKBASE_SUFFIXES):
+            extensions.append(item)
+        elif (
+            name_lower.endswith(_PRIMARY_HTML_SUFFIXES)
+            and "-index" not in name_lower
+            and name_lower not in _INDEX_PAGE_NAMES
+            and not name_lower.startswith(_EXHIBIT_PREFIXES)
+        ):
+            html.append((index, item))
+    extensions.sort(key=attrgetter("name"))
+    if not html:
+        return None, extensions
+
+    # Prefer an HTML whose basename matches the .xsd; avoid SEC-rendered report pages (R1.htm, etc.);
+    # then prefer largest; tie-break by name, then listing order, for determinism.
+    primary = min(
+        (
+            0 if Path(item.name).stem in xsd_stems else 1,
+            1 if _looks_like_sec_report_page(item.name) else 0,
+            -(item.size if item.size is not None else -1),
+            item.name,
+            index,
+            item,
+        )
+        for index, item in html
+    )[-1]
     return primary, extensions
 
 
@@ -170,28 +365,117 @@ def download_artifacts(
     *,
     user_agent: str,
     min_interval_seconds: float = _DEFAULT_MIN_INTERVAL_SECONDS,
-    rate_limiter: RateLimiter | None = None,
+    rate_limiter: TokenBucket | None = None,
+    session: EdgarSession | None = None,
+    max_workers: int = _DEFAULT_DOWNLOAD_WORKERS,
 ) -> list[Path]:
-    """Download accession artifacts with rate limiting and required User-Agent."""
+    """Download accession artifacts with rate limiting and required User-Agent.
+
+    Up to ``max_workers`` downloads run concurrently, each worker on its own
+    keep-alive connection, while one shared limiter keeps request starts at
+    least ``min_interval_seconds`` apart. A passed ``session`` serves a serial
+    run (one worker or one item) and otherwise one of the workers, so its
+    open connection is reused; the remaining workers get private sessions.
+    Repeated names are downloaded once. Returned paths are in name order
+    regardless of completion order.
+    """
     _validate_user_agent(user_agent)
     out_dir.mkdir(parents=True, exist_ok=True)
-    saved: list[Path] = []
-    limiter = rate_limiter or RateLimiter(min_interval_seconds=min_interval_seconds)
-    for item in sorted(items, key=lambda i: i.name):
-        url = f"{base_url.rstrip('/')}/{item.name}"
-        dest = out_dir / item.name
-        _download(url, dest, user_agent=user_agent, rate_limiter=limiter)
-        saved.append(dest)
-    return saved
+    limiter = rate_limiter or RateLimiter(min_interval_seconds)
+    base = base_url.rstrip('/')
+    # One job per name: concurrent workers must never share a destination (.part) file.
+    jobs = [(f"{base}/{name}", out_dir / name) for name in sorted({item.name for item in items})]
+
+    workers = min(max_workers, len(jobs))
+    if workers <= 1:
+        with _session_scope(session) as session:
+            for url, dest in jobs:
+                _download(url, dest, user_agent=user_agent, rate_limiter=limiter, session=session)
+    else:
+        _download_concurrently(
+            jobs, user_agent=user_agent, rate_limiter=limiter, max_workers=workers, session=session
+        )
+    return [dest for _url, dest in jobs]
 
 
-def _download(url: str, dest: Path, *, user_agent: str, rate_limiter: RateLimiter | None = None) -> None:
-    _validate_user_agent(user_agent)
+def _download_concurrently(
+    jobs: list[tuple[str, Path]],
+    *,
+    user_agent: str,
+    rate_limiter: TokenBucket,
+    max_workers: int,
+    session: EdgarSession | None = None,
+) -> None:
+    """Run downloads on a thread pool with one EdgarSession per worker thread.
+
+    The first worker adopts the caller's ``session`` (left open on return);
+    the others open private sessions, closed when the pool is done.
+    """
+    local = threading.local()
+    shared = [session] if session is not None else []
+    sessions: list[EdgarSession] = []
+    sessions_lock = threading.Lock()
+
+    def worker(url: str, dest: Path) -> None:
+        session = getattr(local, "session", None)
+        if session is None:
+            with sessions_lock:
+                if shared:
+                    session = shared.pop()
+                else:
+                    session = EdgarSession()
+                    sessions.append(session)
+            local.session = session
+        _download(url, dest, user_agent=user_agent, rate_limiter=rate_limiter, session=session)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="xew-edgar") as executor:
+            futures = [executor.submit(worker, url, dest) for url, dest in jobs]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+    finally:
+        for session in sessions:
+            session.close()
+
+
+def _download(
+    url: str,
+    dest: Path,
+    *,
+    user_agent: str,
+    rate_limiter: TokenBucket | None = None,
+    session: EdgarSession | None = None,
+) -> None:
+    # user_agent is validated by the public entrypoints that call this.
     if rate_limiter:
         rate_limiter.wait()
-    req = urllib.request.Request(url, headers={"User-Agent": user_agent})
-    with urllib.request.urlopen(req) as resp:
-        dest.write_bytes(resp.read())
+    # Stream the body to disk in chunks instead of buffering it in memory; the
+    # .part file keeps a failed transfer from leaving a truncated artifact.
+    part = dest.with_name(dest.name + ".part")
+    with _session_scope(session) as session:
+        with session.open(url, headers={"User-Agent": user_agent}) as resp:
+            try:
+                with part.open("wb") as f:
+                    shutil.copyfileobj(resp, f, _DOWNLOAD_CHUNK_SIZE)
+                os.replace(part, dest)
+            except BaseException:
+                part.unlink(missing_ok=True)
+                raise
+
+
+@contextmanager
+def _session_scope(session: EdgarSession | None) -> Iterator[EdgarSession]:
+    """Yield the caller's session, or a private one closed on exit."""
+    if session is not None:
+        yield session
+        return
+    with EdgarSession() as private:
+        yield private
 
 
 def _looks_like_sec_report_page(filename: str) -> bool:
@@ -208,22 +492,39 @@ def _looks_like_sec_report_page(filename: str) -> bool:
 def _coerce_int(value: object) -> int | None:
     if value is None:
         return None
+    # Fast paths for the usual index sizes: ints and plain digit strings.
+    if type(value) is int:
+        return value
+    if type(value) is str and value.isdecimal():
+        return int(value)
     try:
         return int(value)
     except (TypeError, ValueError):
         return None
 
 
-def _fetch_text(url: str, *, user_agent: str, rate_limiter: RateLimiter | None = None) -> str:
-    _validate_user_agent(user_agent)
+def _fetch_text(
+    url: str,
+    *,
+    user_agent: str,
+    rate_limiter: TokenBucket | None = None,
+    session: EdgarSession | None = None,
+) -> str:
+    # user_agent is validated by the public entrypoints that call this.
     if rate_limiter:
         rate_limiter.wait()
-    req = urllib.request.Request(url, headers={"User-Agent": user_agent})
-    with urllib.request.urlopen(req) as resp:
-        return resp.read().decode("utf-8", errors="replace")
+    with _session_scope(session) as session:
+        with session.open(url, headers={"User-Agent": user_agent}) as resp:
+            return resp.read().decode("utf-8", errors="replace")
 
 
-def _validate_user_agent(user_agent: str) -> None:
+@lru_cache(maxsize=32)
+def _validate_user_agent(user_agent: str) -> str:
+    """Return ``user_agent`` if it is SEC-compliant, else raise ValueError.
+
+    Successful results are memoized, so repeat checks of the same string are a
+    dict lookup; failures are not cached and raise on every call.
+    """
     if not user_agent or len(user_agent.strip()) < _USER_AGENT_MIN_LEN:
         raise ValueError("User-Agent must be a non-empty, descriptive string with contact info.")
     lower = user_agent.lower()
@@ -231,6 +532,7 @@ def _validate_user_agent(user_agent: str) -> None:
         raise ValueError("User-Agent must not be the default urllib value; include identifying contact info.")
     if not any(token in lower for token in _USER_AGENT_CONTACT_TOKENS):
         raise ValueError("User-Agent must include contact info (email, URL, or phone).")
+    return user_agent
 
 
 # Cache-integrated versions for deterministic retrieval + metadata recording
@@ -240,7 +542,8 @@ def fetch_accession_items_cached(
     accession: str,
     *,
     user_agent: str,
-    cache: Optional['DeterministicCache'] = None
+    cache: Optional['DeterministicCache'] = None,
+    session: Optional[EdgarSession] = None,
 ) -> Tuple[List[EdgarDirectoryItem], List['RetrievalMetadata']]:
     """Fetch EDGAR index with optional caching and metadata recording."""
     from .cache import create_retrieval_metadata
@@ -251,8 +554,9 @@ def fetch_accession_items_cached(
     html_url = f"{base}/index.html"
 
     metadata_records = []
+    limiter = None if cache else RateLimiter()
 
-    # Try JSON first, then HTML fallback
+    # Try JSON first, then HTML fallback when index.json is missing or unparseable
     try:
         if cache:
             from .cache import cached_edgar_download
@@ -264,12 +568,13 @@ def fetch_accession_items_cached(
             text = content.decode('utf-8', errors='replace')
         else:
             # Non-cached path
-            limiter = RateLimiter()
-            text = _fetch_text(json_url, user_agent=user_agent, rate_limiter=limiter)
+            text = _fetch_text(json_url, user_agent=user_agent, rate_limiter=limiter, session=session)
 
         return parse_index_json(text), metadata_records
 
-    except (HTTPError, URLError, ValueError):
+    except (HTTPError, ValueError) as e:
+        if isinstance(e, HTTPError) and e.code != 404:
+            raise
         # Fallback to HTML
         if cache:
             from .cache import cached_edgar_download
@@ -281,8 +586,7 @@ def fetch_accession_items_cached(
             text = content.decode('utf-8', errors='replace')
         else:
             # Non-cached path
-            limiter = RateLimiter()
-            text = _fetch_text(html_url, user_agent=user_agent, rate_limiter=limiter)
+            text = _fetch_text(html_url, user_agent=user_agent, rate_limiter=limiter, session=session)
 
         return parse_index_html(text), metadata_records
 
@@ -294,36 +598,50 @@ def download_artifacts_cached(
     *,
     user_agent: str,
     min_interval_seconds: float = _DEFAULT_MIN_INTERVAL_SECONDS,
-    rate_limiter: Optional[RateLimiter] = None,
+    rate_limiter: Optional[TokenBucket] = None,
     cache: Optional['DeterministicCache'] = None,
+    session: Optional[EdgarSession] = None,
 ) -> Tuple[List[Path], List['RetrievalMetadata']]:
-    """Download accession artifacts with optional caching and metadata recording."""
+    """Download accession artifacts with optional caching and metadata recording.
+
+    Artifacts are fetched in the order given (callers pass a deterministic
+    order, primary first); repeated names are downloaded once. Returned paths
+    and metadata records follow that order.
+    """
     _validate_user_agent(user_agent)
     out_dir.mkdir(parents=True, exist_ok=True)
     saved: List[Path] = []
+    seen: set[str] = set()
     metadata_records: List['RetrievalMetadata'] = []
     limiter = rate_limiter or RateLimiter(min_interval_seconds=min_interval_seconds)
 
-    for item in sorted(items, key=lambda i: i.name):
-        url = f"{base_url.rstrip('/')}/{item.name}"
-        dest = out_dir / item.name
-
-        if cache:
-            # Use cached download
-            from .cache import cached_edgar_download
-            if limiter:
-                limiter.wait()
-            content, metadata = cached_edgar_download(
-                cache, url, user_agent=user_agent,
-                notes=f"EDGAR artifact: {item.name}"
-            )
-            dest.write_bytes(content)
-            metadata_records.append(metadata)
-        else:
-            # Direct download (existing logic)
-            _download(url, dest, user_agent=user_agent, rate_limiter=limiter)
-
-        saved.append(dest)
+    base = base_url.rstrip('/')
+
+    # Connections are opened lazily, so a private session costs nothing on cache hits.
+    with _session_scope(session) as session:
+        for item in items:
+            if item.name in seen:
+                continue
+            seen.add(item.name)
+            url = f"{base}/{item.name}"
+            dest = out_dir / item.name
+
+            if cache:
+                # Use cached download
+                from .cache import cached_edgar_download
+                if limiter:
+                    limiter.wait()
+                content, metadata = cached_edgar_download(
+                    cache, url, user_agent=user_agent,
+                    notes=f"EDGAR artifact: {item.name}"
+                )
+                dest.write_bytes(content)
+                metadata_records.append(metadata)
+            else:
+                # Direct download (existing logic)
+                _download(url, dest, user_agent=user_agent, rate_limiter=limiter, session=session)
+
+            saved.append(dest)
 
     return saved, metadata_records
 
@@ -338,20 +656,22 @@ def collect_accession_artifacts_cached(
     cache: Optional['DeterministicCache'] = None,
 ) -> Tuple[Path, List[Path], List['RetrievalMetadata']]:
     """Complete cached workflow: fetch index, select artifacts, download with metadata."""
-    # Fetch directory listing with caching
-    items, index_metadata = fetch_accession_items_cached(
-        cik, accession, user_agent=user_agent, cache=cache
-    )
-
-    # Select primary and extension artifacts
-    primary, extensions = collect_accession_artifacts(items)
-
-    # Download artifacts with caching
-    base_url = accession_base_url(cik, accession)
-    downloaded, download_metadata = download_artifacts_cached(
-        base_url, [primary] + extensions, out_dir,
-        user_agent=user_agent, min_interval_seconds=min_interval_seconds, cache=cache
-    )
+    with EdgarSession() as session:
+        # Fetch directory listing with caching
+        items, index_metadata = fetch_accession_items_cached(
+            cik, accession, user_agent=user_agent, cache=cache, session=session
+        )
+
+        # Select primary and extension artifacts
+        primary, extensions = collect_accession_artifacts(items)
+
+        # Download artifacts with caching
+        base_url = accession_base_url(cik, accession)
+        downloaded, download_metadata = download_artifacts_cached(
+            base_url, [primary] + extensions, out_dir,
+            user_agent=user_agent, min_interval_seconds=min_interval_seconds, cache=cache,
+            session=session,
+        )
 
     # Combine all metadata
     all_metadata = index_metadata + download_metadata
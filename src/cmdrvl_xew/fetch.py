@@ -4,7 +4,13 @@ import argparse
 import re
 from pathlib import Path
 
-from .edgar_fetch import accession_base_url, collect_accession_artifacts, download_artifacts, fetch_accession_items
+from .edgar_fetch import (
+    EdgarSession,
+    accession_base_url,
+    collect_accession_artifacts,
+    download_artifacts,
+    fetch_accession_items,
+)
 from .exit_codes import exit_invocation_error, exit_system_error, ExitCode
 
 _ACCESSION_RE = re.compile(r"^\d{10}-\d{2}-\d{6}$")
@@ -27,17 +33,22 @@ def run_fetch(args: argparse.Namespace) -> int:
     if not user_agent:
         exit_invocation_error("--user-agent is required for EDGAR access")
 
-    items = fetch_accession_items(cik, accession, user_agent=user_agent)
-    primary, extensions = collect_accession_artifacts(items)
     base_url = accession_base_url(cik, accession)
 
-    downloaded = download_artifacts(
-        base_url,
-        [primary, *extensions],
-        out_dir,
-        user_agent=user_agent,
-        min_interval_seconds=args.min_interval,
-    )
+    # The index fetch's keep-alive connection is reused by the artifact downloads
+    # (serially, or by one of the download workers).
+    with EdgarSession() as session:
+        items = fetch_accession_items(cik, accession, user_agent=user_agent, session=session)
+        primary, extensions = collect_accession_artifacts(items)
+
+        downloaded = download_artifacts(
+            base_url,
+            [primary, *extensions],
+            out_dir,
+            user_agent=user_agent,
+            min_interval_seconds=args.min_interval,
+            session=session,
+        )
 
     print(f"Primary iXBRL: {primary.name}")
     print(f"Downloaded {len(downloaded)} files to {out_dir}:")
@@ -4,16 +4,55 @@ This module converts DetectorFinding objects into the v1 xew_findings.json forma
 with deterministic ordering and schema compliance.
 """
 
-import json
+import heapq
 import logging
-from datetime import datetime, timezone
+import os
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 
 from .detectors._base import DetectorFinding, DetectorInstance, DetectorContext
+from .detectors.p005_taxonomy import P005_ISSUE_CODE_SET
+from .util import _SHA256_HEX_RE, dumps_json_pretty, utc_now_iso
 
 logger = logging.getLogger(__name__)
 
+FINDINGS_SCHEMA_ID = "cmdrvl.xew_findings"
+FINDINGS_SCHEMA_VERSION = "1.0"
+
+# Sort keys shared by every document build.
+_FINDING_KEY = attrgetter('finding_id')
+_INSTANCE_KEY = attrgetter('instance_id')
+# Normalized citations always carry 'source' and 'citation'.
+_RULE_BASIS_KEY = itemgetter('source', 'citation')
+
+
+# Substring -> schema enum for rule basis sources, checked in order (first match wins).
+_RULE_BASIS_SOURCES = (
+    ('XBRL SPECIFICATION 2.1', 'XBRL_SPEC'),
+    ('XBRL_21', 'XBRL_SPEC'),
+    ('XBRL SPEC', 'XBRL_SPEC'),
+    ('SEC EFM', 'SEC_EFM'),
+    ('EFM', 'SEC_EFM'),
+    ('ARELLE', 'ARELLE_VALIDATION'),
+    ('DQCRT', 'DQCRT'),
+    ('OTHER', 'OTHER'),
+)
+
+
+def _break_trigger_key(trigger: Dict[str, Any]) -> str:
+    # Detector-supplied triggers may lack an id; those sort first.
+    return trigger.get('id', '')
+
+
+def _marker_key(marker: Dict[str, Any]) -> tuple:
+    boundary = marker.get("boundary", {})
+    return (
+        marker.get("marker_id", ""),
+        boundary.get("from_accession", ""),
+        boundary.get("to_accession", ""),
+    )
+
 
 class FindingsWriter:
     """Writer for deterministic xew_findings.json output."""
@@ -42,7 +81,9 @@ class FindingsWriter:
             input_metadata: Input filing metadata
             ext_metadata: Extension metadata for forward compatibility
             markers: Optional list of marker dicts for findings output
-            generated_at: Optional ISO timestamp override for findings output
+            generated_at: Optional ISO timestamp override for findings output; defaults
+                to the current UTC time at second precision (e.g. 2025-01-01T00:00:00Z).
+                Pass one timestamp to stamp every document of a run identically.
         """
         # Generate complete findings document
         findings_doc = self._build_findings_document(
@@ -66,16 +107,14 @@ class FindingsWriter:
         """Build the complete findings JSON document."""
 
         # Convert findings to schema format with deterministic ordering
-        findings_json = []
-        for finding in sorted(findings, key=lambda f: f.finding_id):
-            finding_json = self._convert_finding_to_json(finding)
-            findings_json.append(finding_json)
+        convert_finding = self._convert_finding_to_json
+        findings_json = [convert_finding(finding) for finding in sorted(findings, key=_FINDING_KEY)]
 
         # Build complete document
         document = {
-            "schema_id": "cmdrvl.xew_findings",
-            "schema_version": "1.0",
-            "generated_at": generated_at or datetime.now(timezone.utc).isoformat(),
+            "schema_id": FINDINGS_SCHEMA_ID,
+            "schema_version": FINDINGS_SCHEMA_VERSION,
+            "generated_at": generated_at or utc_now_iso(),
             "toolchain": toolchain,
             "input": input_metadata,
             "artifacts": artifacts,
@@ -83,14 +122,7 @@ class FindingsWriter:
         }
 
         if markers:
-            document["markers"] = sorted(
-                markers,
-                key=lambda m: (
-                    m.get("marker_id", ""),
-                    m.get("boundary", {}).get("from_accession", ""),
-                    m.get("boundary", {}).get("to_accession", ""),
-                ),
-            )
+            document["markers"] = sorted(markers, key=_marker_key)
 
         # Add extension metadata if provided (forward compatibility)
         if ext_metadata:
@@ -101,17 +133,19 @@ class FindingsWriter:
     def _convert_finding_to_json(self, finding: DetectorFinding) -> Dict[str, Any]:
         """Convert DetectorFinding to JSON schema format."""
 
-        # Build observed instances with schema compliance
-        observed_instances = []
-        for instance in sorted(finding.instances, key=lambda i: i.instance_id):
-            instance_json = self._convert_instance_to_json(instance, finding.pattern_id)
-            observed_instances.append(instance_json)
-
-        # Apply truncation for large instance lists (deterministic)
+        # Apply truncation for large instance lists (deterministic): select the
+        # lowest instance_ids first so only the kept instances are converted.
         max_instances = 100  # Schema compliance limit
-        truncated = len(observed_instances) > max_instances
+        truncated = len(finding.instances) > max_instances
         if truncated:
-            observed_instances = observed_instances[:max_instances]
+            selected = heapq.nsmallest(max_instances, finding.instances, key=_INSTANCE_KEY)
+        else:
+            selected = sorted(finding.instances, key=_INSTANCE_KEY)
+
+        # Build observed instances with schema compliance
+        convert_instance = self._convert_instance_to_json
+        pattern_id = finding.pattern_id
+        observed_instances = [convert_instance(instance, pattern_id) for instance in selected]
 
         # Build finding JSON with schema-compliant observed block
         finding_json = {
@@ -121,7 +155,7 @@ class FindingsWriter:
             "alert_eligible": finding.alert_eligible,
             "status": finding.status,
             "human_review_required": finding.human_review_required,
-            "break_triggers": sorted(finding.break_triggers, key=lambda t: t.get('id', '')),
+            "break_triggers": sorted(finding.break_triggers, key=_break_trigger_key),
             "observed": {
                 "instance_count_total": len(finding.instances),
                 "instance_count_included": len(observed_instances),
@@ -137,18 +171,14 @@ class FindingsWriter:
             finding_json["suppression_reason"] = finding.suppression_reason
 
         if finding.rule_basis:
-            # Normalize and validate rule basis citations for schema compliance
-            normalized_citations = []
-            for citation in finding.rule_basis:
-                normalized = self._normalize_rule_basis_citation(citation)
-                if normalized:  # Only include valid citations
-                    normalized_citations.append(normalized)
+            # Normalize and validate rule basis citations; only valid ones are kept
+            normalized_citations = list(
+                filter(None, map(self._normalize_rule_basis_citation, finding.rule_basis))
+            )
 
             if normalized_citations:
-                finding_json["rule_basis"] = sorted(
-                    normalized_citations,
-                    key=lambda r: (r.get('source', ''), r.get('citation', ''))
-                )
+                normalized_citations.sort(key=_RULE_BASIS_KEY)
+                finding_json["rule_basis"] = normalized_citations
 
         return finding_json
 
@@ -162,18 +192,9 @@ class FindingsWriter:
         }
 
         # Add pattern-specific data fields in schema-compliant format
-        if pattern_id == "XEW-P001":
-            instance_json["data"] = self._format_p001_data(instance.data)
-        elif pattern_id == "XEW-P002":
-            instance_json["data"] = self._format_p002_data(instance.data)
-        elif pattern_id == "XEW-P004":
-            instance_json["data"] = self._format_p004_data(instance.data)
-        elif pattern_id == "XEW-P005":
-            instance_json["data"] = self._format_p005_data(instance.data)
-        elif pattern_id == "XEW-P008":
-            instance_json["data"] = self._format_p008_data(instance.data)
-        elif pattern_id == "XEW-P009":
-            instance_json["data"] = self._format_p009_data(instance.data)
+        formatter = _INSTANCE_DATA_FORMATTERS.get(pattern_id)
+        if formatter is not None:
+            instance_json["data"] = formatter(self, instance.data)
         else:
             # Generic data handling for unknown patterns
             instance_json["data"] = instance.data
@@ -191,50 +212,45 @@ class FindingsWriter:
             Schema-compliant citation dict or None if invalid
         """
         try:
+            get = citation.get
+
             # Extract and normalize source
-            raw_source = citation.get('source', '').upper()
-            source_mapping = {
-                'XBRL SPECIFICATION 2.1': 'XBRL_SPEC',
-                'XBRL_21': 'XBRL_SPEC',
-                'XBRL SPEC': 'XBRL_SPEC',
-                'SEC EFM': 'SEC_EFM',
-                'EFM': 'SEC_EFM',
-                'ARELLE': 'ARELLE_VALIDATION',
-                'DQCRT': 'DQCRT',
-                'OTHER': 'OTHER'
-            }
+            raw_source = get('source', '').upper()
 
             # Map source to schema enum
             source = None
-            for key, value in source_mapping.items():
-                if key in raw_source:
+            for needle, value in _RULE_BASIS_SOURCES:
+                if needle in raw_source:
                     source = value
                     break
 
             if not source:
                 source = 'OTHER'  # Default fallback
 
-            # Build normalized citation
+            # Build normalized citation ('title' is only read when 'citation' is absent)
             normalized = {
                 'source': source,
-                'citation': str(citation.get('citation', citation.get('title', ''))),
+                'citation': str(citation['citation'] if 'citation' in citation else get('title', '')),
             }
 
             # Add optional fields if present and valid
-            if citation.get('url'):
-                normalized['url'] = citation['url']
+            url = get('url')
+            if url:
+                normalized['url'] = url
 
-            if citation.get('retrieved_at'):
-                normalized['retrieved_at'] = citation['retrieved_at']
+            retrieved_at = get('retrieved_at')
+            if retrieved_at:
+                normalized['retrieved_at'] = retrieved_at
 
-            if citation.get('sha256'):
-                sha256 = citation['sha256']
+            sha256 = get('sha256')
+            if sha256:
                 # Validate SHA256 format (64 hex chars)
-                if len(sha256) == 64 and all(c in '0123456789abcdefABCDEF' for c in sha256):
+                if _SHA256_HEX_RE.match(sha256):
                     normalized['sha256'] = sha256.lower()
 
-            if citation.get('notes'):
-                normalized['notes'] = citation['notes']
+            notes = get('notes')
+            if notes:
+                normalized['notes'] = notes
 
             # Validate minimum required fields
             if not normalized['citation']:
@@ -368,10 +384,10 @@ class FindingsWriter:
         issue_code = data.get("issue_code", "namespace_schema_ref_mismatch")
 
         # Schema only accepts specific issue codes
-        valid_issue_codes = ["mixed_taxonomy_versions", "namespace_schema_ref_mismatch"]
-        if issue_code not in valid_issue_codes:
+        if issue_code not in P005_ISSUE_CODE_SET:
             # Map common variants to valid codes
-            if "version" in issue_code.lower() or "mismatch" in issue_code.lower():
+            issue_code_lower = issue_code.lower()
+            if "version" in issue_code_lower or "mismatch" in issue_code_lower:
                 result["issue_code"] = "mixed_taxonomy_versions"
             else:
                 result["issue_code"] = "namespace_schema_ref_mismatch"
@@ -425,7 +441,7 @@ class FindingsWriter:
                     for item in repair
                     if isinstance(item, dict)
                 ),
-                key=lambda item: (item["target"], item["action"]),
+                key=itemgetter("target", "action"),
             )
 
         diagnostics = data.get("diagnostics")
@@ -439,7 +455,7 @@ class FindingsWriter:
                     for item in diagnostics
                     if isinstance(item, dict)
                 ),
-                key=lambda item: (item["issue_code"], item["message"]),
+                key=itemgetter("issue_code", "message"),
             )
 
         return result
@@ -581,7 +597,7 @@ class FindingsWriter:
                     for item in repair
                     if isinstance(item, dict)
                 ),
-                key=lambda item: (item["target"], item["action"]),
+                key=itemgetter("target", "action"),
             )
 
         diagnostics = data.get("diagnostics")
@@ -595,7 +611,7 @@ class FindingsWriter:
                     for item in diagnostics
                     if isinstance(item, dict)
                 ),
-                key=lambda item: (item["issue_code"], item["message"]),
+                key=itemgetter("issue_code", "message"),
             )
 
         return result
@@ -680,16 +696,27 @@ class FindingsWriter:
         # Ensure parent directory exists
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write with deterministic formatting
-        with open(self.output_path, 'w', encoding='utf-8') as f:
-            json.dump(
-                document,
-                f,
-                indent=2,
-                sort_keys=True,  # Deterministic key ordering
-                ensure_ascii=False,
-                separators=(',', ': ')
-            )
+        # Encode fully before touching the output, then swap it in atomically so a
+        # crash or encoding error never leaves a truncated findings file behind.
+        data = dumps_json_pretty(document)
+        tmp = self.output_path.with_name(self.output_path.name + ".tmp")
+        try:
+            tmp.write_bytes(data)
+            os.replace(tmp, self.output_path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+
+# Pattern-specific instance data formatters, dispatched by pattern_id.
+_INSTANCE_DATA_FORMATTERS: Dict[str, Callable[[FindingsWriter, Dict[str, Any]], Dict[str, Any]]] = {
+    "XEW-P001": FindingsWriter._format_p001_data,
+    "XEW-P002": FindingsWriter._format_p002_data,
+    "XEW-P004": FindingsWriter._format_p004_data,
+    "XEW-P005": FindingsWriter._format_p005_data,
+    "XEW-P008": FindingsWriter._format_p008_data,
+    "XEW-P009": FindingsWriter._format_p009_data,
+}
 
 
 # Factory functions for convenience
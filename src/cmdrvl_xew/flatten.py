@@ -18,8 +18,10 @@ This module flattens the EDGAR structure so Arelle can resolve references.
 from __future__ import annotations
 
 import argparse
+import os
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -38,12 +40,36 @@ _EDGAR_EXHIBIT_DIRS: tuple[tuple[str, str], ...] = (
     ("EX-101.PRE", "_pre.xml"),
 )
 
+# Upper bound on concurrent copies in run_flatten (one per output file)
+_COPY_WORKERS = 8
+
 # Form type directories (where the primary iXBRL lives)
 _FORM_DIRS: tuple[str, ...] = ("10-K", "10-K/A", "10-Q", "10-Q/A", "20-F", "6-K", "8-K", "8-K/A")
 
+# Match <link:schemaRef ... xlink:href="..." /> or <schemaRef ... href="..." />
+# The href attribute may come before or after xlink:type
+_SCHEMA_REF_RE = re.compile(
+    rb'<(?:link:)?schemaRef[^>]*?(?:xlink:)?href\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE
+)
+_SCHEMA_REF_SCAN_BYTES = 64 * 1024
+
+# Bytes read from each end of a file to detect the EDGAR <XBRL> wrapper.
+_WRAPPER_PROBE_BYTES = 4096
 
-def _sorted_dir_entries(path: Path) -> list[Path]:
-    return sorted(path.iterdir(), key=lambda p: p.name)
+
+def _sorted_dir_files(path: Path) -> list[Path]:
+    """Regular files (symlinks followed) directly under path, sorted by name.
+
+    os.scandir reports the file type from the directory listing, so unlike
+    Path.iterdir() + is_file() this needs no stat per entry. A missing path
+    or non-directory yields no files.
+    """
+    try:
+        with os.scandir(path) as it:
+            names = sorted(entry.name for entry in it if entry.is_file())
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    return [path / name for name in names]
 
 
 def _strip_xbrl_wrapper(data: bytes) -> tuple[bytes, bool]:
@@ -74,8 +100,32 @@ def _strip_xbrl_wrapper(data: bytes) -> tuple[bytes, bool]:
     return inner, True
 
 
+def _may_have_xbrl_wrapper(src: Path) -> bool:
+    """Probe only the ends of src for the EDGAR <XBRL> wrapper.
+
+    False means _strip_xbrl_wrapper would leave the file unchanged. True means
+    the full content must be checked (wrapper markers found, or an end is all
+    whitespace within the probe window).
+    """
+    with src.open("rb") as f:
+        head = f.read(_WRAPPER_PROBE_BYTES).lstrip(b"\r\n\t ")
+        size = f.seek(0, os.SEEK_END)
+        f.seek(max(0, size - _WRAPPER_PROBE_BYTES))
+        tail = f.read().rstrip()
+    if len(head) < len(b"<XBRL>") or len(tail) < len(b"</xbrl>"):
+        return True
+    return head.startswith((b"<XBRL>", b"<xbrl>", b"RL>")) and tail.lower().endswith(b"</xbrl>")
+
+
 def _copy_with_optional_wrapper_strip(src: Path, dst: Path) -> bool:
     """Copy src to dst, stripping EDGAR <XBRL> wrapper if detected."""
+    if not _may_have_xbrl_wrapper(src):
+        # Unwrapped (the common case): let shutil copy in the kernel without
+        # reading the file into memory.
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(src, dst)
+        return False
+
     data = src.read_bytes()
     normalized, changed = _strip_xbrl_wrapper(data)
     dst.parent.mkdir(parents=True, exist_ok=True)
@@ -93,13 +143,11 @@ def _find_primary_ixbrl(edgar_dir: Path) -> Path | None:
     Returns the first match (typically there's only one primary document).
     """
     for form_dir in _FORM_DIRS:
-        form_path = edgar_dir / form_dir
-        if form_path.is_dir():
-            for f in _sorted_dir_entries(form_path):
-                if f.is_file() and f.suffix.lower() in (".htm", ".html"):
-                    # Skip exhibit files (e.g., ex31-1.htm)
-                    if not f.name.lower().startswith("ex"):
-                        return f
+        for f in _sorted_dir_files(edgar_dir / form_dir):
+            if f.suffix.lower() in (".htm", ".html"):
+                # Skip exhibit files (e.g., ex31-1.htm)
+                if not f.name.lower().startswith("ex"):
+                    return f
     return None
 
 
@@ -115,18 +163,22 @@ def _extract_schema_ref(ixbrl_path: Path) -> str | None:
     encoding issues or garbage bytes that break strict XML parsers.
     """
     # The schemaRef is typically in the first ~50KB of the file (in ix:header).
-    # Read a chunk to avoid loading multi-MB files fully.
+    # Read only that chunk to avoid loading multi-MB files fully.
     try:
-        content = ixbrl_path.read_bytes()[:64 * 1024].decode("utf-8", errors="ignore")
+        with ixbrl_path.open("rb") as f:
+            content = f.read(_SCHEMA_REF_SCAN_BYTES)
     except Exception:
         return None
 
-    # Match <link:schemaRef ... xlink:href="..." /> or <schemaRef ... href="..." />
-    # The href attribute may come before or after xlink:type
-    pattern = r'<(?:link:)?schemaRef[^>]*?(?:xlink:)?href\s*=\s*["\']([^"\']+)["\']'
-    match = re.search(pattern, content, re.IGNORECASE)
+    # Locate the literal tag name with a C-level find first, then run the regex
+    # only from there (every match contains "schemaref"; "<link:" may precede it).
+    # Search the raw bytes; only the captured href is decoded.
+    anchor = content.lower().find(b"schemaref")
+    if anchor < 0:
+        return None
+    match = _SCHEMA_REF_RE.search(content, max(0, anchor - len(b"<link:")))
     if match:
-        return match.group(1)
+        return match.group(1).decode("utf-8", errors="ignore")
 
     return None
 
@@ -148,26 +200,18 @@ def _find_extension_files(edgar_dir: Path, schema_basename: str) -> dict[str, Pa
         Dict mapping target filename to source path.
         E.g., {"frt-20250930.xsd": Path("EX-101.SCH/frt-20250930.xsd")}
     """
+    # Each exhibit directory holds at most one file of interest:
+    # schema_basename + its suffix (.xsd, _cal.xml, _def.xml, ...).
+    expected = {
+        exhibit_dir: f"{schema_basename}{suffix}" for exhibit_dir, suffix in _EDGAR_EXHIBIT_DIRS
+    }
     found: dict[str, Path] = {}
 
-    for exhibit_dir, suffix in _EDGAR_EXHIBIT_DIRS:
-        exhibit_path = edgar_dir / exhibit_dir
-        if not exhibit_path.is_dir():
-            continue
-
-        # Look for files matching the schema basename
-        for f in _sorted_dir_entries(exhibit_path):
-            if not f.is_file():
-                continue
-            # Match by basename pattern (schema_basename + expected suffix)
-            if suffix == ".xsd":
-                if f.name == f"{schema_basename}.xsd":
-                    found[f.name] = f
-            else:
-                # Linkbases: schema_basename + _cal.xml, _def.xml, etc.
-                expected_name = f"{schema_basename}{suffix}"
-                if f.name == expected_name:
-                    found[f.name] = f
+    for exhibit_dir, expected_name in expected.items():
+        for f in _sorted_dir_files(edgar_dir / exhibit_dir):
+            if f.name == expected_name:
+                found[f.name] = f
+                break
 
     return found
 
@@ -180,17 +224,27 @@ def _find_all_extension_files_by_scan(edgar_dir: Path) -> dict[str, Path]:
     found: dict[str, Path] = {}
 
     for exhibit_dir, _suffix in _EDGAR_EXHIBIT_DIRS:
-        exhibit_path = edgar_dir / exhibit_dir
-        if not exhibit_path.is_dir():
-            continue
-
-        for f in _sorted_dir_entries(exhibit_path):
-            if f.is_file() and f.suffix.lower() in (".xsd", ".xml"):
+        for f in _sorted_dir_files(edgar_dir / exhibit_dir):
+            if f.suffix.lower() in (".xsd", ".xml"):
                 found[f.name] = f
 
     return found
 
 
+def _copy_files(jobs: list[tuple[str, Path]], out_dir: Path) -> list[bool]:
+    """Copy each (target name, source) into out_dir; return wrapper-strip flags in job order."""
+
+    def copy(job: tuple[str, Path]) -> bool:
+        name, src = job
+        return _copy_with_optional_wrapper_strip(src, out_dir / name)
+
+    workers = min(_COPY_WORKERS, len(jobs))
+    if workers <= 1:
+        return [copy(job) for job in jobs]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="xew-flatten") as executor:
+        return list(executor.map(copy, jobs))
+
+
 def run_flatten(args: argparse.Namespace) -> int:
     """Flatten an EDGAR directory into a flat Arelle-compatible layout."""
     edgar_dir = Path(args.edgar_dir)
@@ -237,23 +291,16 @@ def run_flatten(args: argparse.Namespace) -> int:
         print("Warning: Could not extract schemaRef; scanning all EX-101.* directories")
         extension_files = _find_all_extension_files_by_scan(edgar_dir)
 
-    # Step 3: Copy files to flat output directory
-    copied = []
-    normalized = []
-
-    # Copy primary iXBRL
-    primary_dst = out_dir / primary.name
-    if _copy_with_optional_wrapper_strip(primary, primary_dst):
-        normalized.append(primary.name)
-    copied.append(primary.name)
-
-    # Copy extension files
-    for filename in sorted(extension_files):
-        src_path = extension_files[filename]
-        dst_path = out_dir / filename
-        if _copy_with_optional_wrapper_strip(src_path, dst_path):
-            normalized.append(filename)
-        copied.append(filename)
+    # Step 3: Copy files to flat output directory (primary iXBRL, then
+    # extension files by name). Every source has a distinct target name, so
+    # the copies are independent and overlap their I/O on a thread pool;
+    # results come back in submission order.
+    jobs = [(primary.name, primary)]
+    jobs.extend((filename, extension_files[filename]) for filename in sorted(extension_files))
+    stripped = _copy_files(jobs, out_dir)
+
+    copied = [name for name, _src in jobs]
+    normalized = [name for (name, _src), was_stripped in zip(jobs, stripped) if was_stripped]
 
     print(f"Copied {len(copied)} files to {out_dir}:")
     for name in sorted(copied):
@@ -2,12 +2,21 @@ from __future__ import annotations
 
 import hashlib
 import json
+import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
 from typing import Any, Iterable
 
+try:  # Optional accelerator for parsing; stdlib json is the reference.
+    import orjson as _orjson  # type: ignore
+except ImportError:
+    _orjson = None
+
+# A sha256 digest as hex: exactly 64 hex characters (no surrounding whitespace).
+_SHA256_HEX_RE = re.compile(r"\A[0-9a-fA-F]{64}\Z")
+
 
 def utc_now_iso() -> str:
     """UTC timestamp in ISO 8601 format with 'Z' suffix and no fractional seconds."""
@@ -34,6 +43,73 @@ def write_json(path: Path, obj: Any) -> None:
     path.write_text(data + "\n", encoding="utf-8")
 
 
+def loads_json(data: bytes | str) -> Any:
+    """Parse a JSON document, using orjson when it is installed.
+
+    Decode errors are json.JSONDecodeError (orjson's subclasses it) either way.
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(path: Path) -> Any:
+    """Read and parse a UTF-8 JSON file."""
+    return loads_json(path.read_bytes())
+
+
+_ORJSON_INT_MIN = -(2**63)
+_ORJSON_INT_MAX = 2**64 - 1
+# repr() switches to exponent notation outside this magnitude range.
+_ORJSON_FLOAT_MIN = 1e-4
+_ORJSON_FLOAT_MAX = 1e16
+
+
+def _orjson_renders_identically(obj: Any) -> bool:
+    """True if orjson output for obj matches the stdlib encoder byte for byte.
+
+    That holds for str-keyed dicts, lists/tuples, str, bool, None, 64-bit ints
+    and floats that repr() prints without an exponent (zero, or magnitude in
+    [1e-4, 1e16)); both encoders emit the shortest round-trip digits there.
+    Exponent forms differ ('1e+16' vs '1e16'), as do NaN/Infinity, so those
+    and any other type use the stdlib encoder.
+    """
+    stack = [obj]
+    pop, extend = stack.pop, stack.extend
+    while stack:
+        value = pop()
+        kind = type(value)
+        if kind is str or value is None or kind is bool:
+            continue
+        if kind is dict:
+            for key in value:
+                if type(key) is not str:
+                    return False
+            extend(value.values())
+        elif kind is list or kind is tuple:
+            extend(value)
+        elif kind is int:
+            if not _ORJSON_INT_MIN <= value <= _ORJSON_INT_MAX:
+                return False
+        elif kind is float:
+            if value != 0.0 and not _ORJSON_FLOAT_MIN <= abs(value) < _ORJSON_FLOAT_MAX:
+                return False
+        else:
+            return False
+    return True
+
+
+def dumps_json_pretty(obj: Any) -> bytes:
+    """UTF-8 bytes of json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=False).
+
+    orjson is used when installed and the document only holds types it renders
+    identically; output bytes never depend on whether orjson is available.
+    """
+    if _orjson is not None and _orjson_renders_identically(obj):
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2 | _orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=False, separators=(",", ": ")).encode("utf-8")
+
+
 CANONICAL_SIGNATURE_VERSION = "v1"
 
 
@@ -174,8 +250,29 @@ def canonical_signature_p005(
     *,
     version: str = CANONICAL_SIGNATURE_VERSION,
 ) -> bytes:
-    schema_ref_sha = _sha256_joined_sorted(schema_refs, "schema_refs")
-    ns_sha = _sha256_joined_sorted(namespaces, "namespaces")
+    schema_ref_sha, ns_sha = p005_payload_digests(schema_refs, namespaces)
+    return canonical_signature_p005_from_digests(issue_code, schema_ref_sha, ns_sha, version=version)
+
+
+def p005_payload_digests(schema_refs: Iterable[str], namespaces: Iterable[str]) -> tuple[str, str]:
+    """Return (schemaRefSha256, nsSha256) for a P005 signature.
+
+    Instances of one finding usually share the same payload; compute these
+    once and pass them to canonical_signature_p005_from_digests.
+    """
+    return (
+        _sha256_joined_sorted(schema_refs, "schema_refs"),
+        _sha256_joined_sorted(namespaces, "namespaces"),
+    )
+
+
+def canonical_signature_p005_from_digests(
+    issue_code: str,
+    schema_ref_sha: str,
+    ns_sha: str,
+    *,
+    version: str = CANONICAL_SIGNATURE_VERSION,
+) -> bytes:
     sig_body = f"P005|{issue_code}|schemaRefSha256={schema_ref_sha}|nsSha256={ns_sha}"
     return canonical_signature_bytes(_ensure_ascii(sig_body, "P005 signature"), version=version)
 
@@ -791,15 +888,22 @@ def truncate_with_metadata(
     return truncated_items, metadata
 
 
+def _instance_id_key(instance: dict[str, Any]) -> str:
+    return instance.get('instance_id', '')
+
+
 def truncate_instances(
-    instances: list[dict[str, Any]],
-    limit: int = DEFAULT_INSTANCE_LIMIT
-) -> tuple[list[dict[str, Any]], TruncationInfo]:
+    instances: list[T],
+    limit: int = DEFAULT_INSTANCE_LIMIT,
+    *,
+    sort_key: Callable[[T], Any] | None = None,
+) -> tuple[list[T], TruncationInfo]:
     """Truncate finding instances with deterministic ordering.
 
     Args:
-        instances: List of instance dicts
+        instances: List of instance dicts (or objects, with sort_key)
         limit: Maximum instances to include
+        sort_key: Instance ID accessor (default: dict `instance_id` lookup)
 
     Returns:
         Tuple of (truncated_instances, truncation_info)
@@ -807,19 +911,22 @@ def truncate_instances(
     return truncate_with_metadata(
         instances,
         limit,
-        sort_key=lambda x: x.get('instance_id', '')
+        sort_key=sort_key or _instance_id_key
     )
 
 
 def truncate_examples(
-    instances: list[dict[str, Any]],
-    limit: int = DEFAULT_EXAMPLE_LIMIT
-) -> tuple[list[dict[str, Any]], TruncationInfo]:
+    instances: list[T],
+    limit: int = DEFAULT_EXAMPLE_LIMIT,
+    *,
+    sort_key: Callable[[T], Any] | None = None,
+) -> tuple[list[T], TruncationInfo]:
     """Truncate to example instances for illustration purposes.
 
     Args:
-        instances: List of instance dicts
+        instances: List of instance dicts (or objects, with sort_key)
         limit: Maximum examples to include
+        sort_key: Instance ID accessor (default: dict `instance_id` lookup)
 
     Returns:
         Tuple of (example_instances, truncation_info)
@@ -827,15 +934,17 @@ def truncate_examples(
     return truncate_with_metadata(
         instances,
         limit,
-        sort_key=lambda x: x.get('instance_id', '')
+        sort_key=sort_key or _instance_id_key
     )
 
 
 def create_finding_summary(
-    instances: list[dict[str, Any]],
+    instances: list[T],
     instance_limit: int = DEFAULT_INSTANCE_LIMIT,
     example_limit: int = DEFAULT_EXAMPLE_LIMIT,
     include_examples: bool = False,
+    *,
+    sort_key: Callable[[T], Any] | None = None,
 ) -> dict[str, Any]:
     """Create finding summary with proper instance truncation and metadata.
 
@@ -844,12 +953,16 @@ def create_finding_summary(
         instance_limit: Limit for detailed instances
         example_limit: Limit for example instances
         include_examples: Include non-schema `examples` list when True
+        sort_key: Instance ID accessor; pass one to summarize instance objects
+            (e.g. DetectorInstance) directly instead of their dict form
 
     Returns:
         Dict with 'observed' section containing truncated instances and metadata
     """
     # Truncate full instances
-    truncated_instances, instance_info = truncate_instances(instances, instance_limit)
+    truncated_instances, instance_info = truncate_instances(
+        instances, instance_limit, sort_key=sort_key
+    )
 
     summary = {
         'instance_count_total': instance_info.total_count,
@@ -860,7 +973,9 @@ def create_finding_summary(
 
     if include_examples:
         # Examples are for debugging/illustration and are not part of the v1/v2 schema.
-        example_instances, _example_info = truncate_examples(instances, example_limit)
+        example_instances, _example_info = truncate_examples(
+            instances, example_limit, sort_key=sort_key
+        )
         summary['examples'] = example_instances
 
     return summary
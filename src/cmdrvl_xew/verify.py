@@ -4,6 +4,7 @@ import argparse
 import hashlib
 import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import NamedTuple
 
@@ -211,6 +212,30 @@ class SchemaValidationResult(NamedTuple):
     error_message: str = ""
 
 
+@lru_cache(maxsize=1)
+def _findings_schema_validator():
+    """Findings schema validator, built once per process.
+
+    Loading the packaged schema and checking it against its metaschema is the
+    expensive part of validation; verifying many packs reuses the result.
+    """
+    import jsonschema  # type: ignore
+    from importlib import resources
+
+    schema_text = resources.files("cmdrvl_xew").joinpath("schemas/xew_findings.schema.v1.json").read_text(
+        encoding="utf-8"
+    )
+    schema = json.loads(schema_text)
+
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    try:
+        format_checker = jsonschema.FormatChecker()
+    except AttributeError:
+        format_checker = None
+    return validator_cls(schema, format_checker=format_checker)
+
+
 def _validate_findings_schema(pack_dir: Path, quiet: bool = False, verbose: bool = False) -> SchemaValidationResult:
     """
     Validate xew_findings.json against JSON schema.
@@ -252,24 +277,15 @@ def _validate_findings_schema(pack_dir: Path, quiet: bool = False, verbose: bool
 
     try:
         import jsonschema  # type: ignore
-        from importlib import resources
 
         log_info("Loading JSON schema...")
-        schema_text = resources.files("cmdrvl_xew").joinpath("schemas/xew_findings.schema.v1.json").read_text(
-            encoding="utf-8"
-        )
-        schema = json.loads(schema_text)
+        validator = _findings_schema_validator()
 
         log_info("Validating findings against schema...")
-        try:
-            format_checker = jsonschema.FormatChecker()
-        except AttributeError:
-            format_checker = None
-
-        if format_checker is None:
-            jsonschema.validate(instance=findings, schema=schema)
-        else:
-            jsonschema.validate(instance=findings, schema=schema, format_checker=format_checker)
+        # Same error selection as jsonschema.validate().
+        error = jsonschema.exceptions.best_match(validator.iter_errors(findings))
+        if error is not None:
+            raise error
 
         if not quiet:
             print("✓ xew_findings.json schema validation PASSED")
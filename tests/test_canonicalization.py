@@ -15,6 +15,8 @@ from cmdrvl_xew.util import (
     canonical_signature_p002,
     canonical_signature_p004,
     canonical_signature_p005,
+    canonical_signature_p005_from_digests,
+    p005_payload_digests,
     canonical_signature_p007,
     instance_id_from_signature,
     generate_instance_id,
@@ -214,6 +216,18 @@ class TestP005Signatures(TestCase):
 
         self.assertEqual(result1, result2)
 
+    def test_p005_from_digests_matches_full_signature(self):
+        """Precomputed payload digests yield the same signature bytes."""
+        schema_refs = ["b.xsd", "a.xsd"]
+        namespaces = ["ns2", "ns1"]
+        digests = p005_payload_digests(schema_refs, namespaces)
+
+        for issue_code in ("namespace_schema_ref_mismatch", "mixed_taxonomy_versions"):
+            self.assertEqual(
+                canonical_signature_p005_from_digests(issue_code, *digests),
+                canonical_signature_p005(issue_code, schema_refs, namespaces),
+            )
+
 
 class TestP007Signatures(TestCase):
     """Test P007 orphan facts signature generation."""
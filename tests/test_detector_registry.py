@@ -0,0 +1,297 @@
+"""
+Unit tests for the XEW detector registry.
+"""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from cmdrvl_xew.detectors._base import (
+    BaseDetector,
+    DetectorContext,
+    DetectorError,
+    DetectorFinding,
+)
+from cmdrvl_xew.detectors.registry import DetectorRegistry, _find_detector_class
+
+
+def _make_detector_class(pattern_id: str, *, fail: bool = False, run: bool = True, eligible: bool = True):
+    class _Detector(BaseDetector):
+        @property
+        def pattern_id(self) -> str:
+            return pattern_id
+
+        @property
+        def pattern_name(self) -> str:
+            return f"Test {pattern_id}"
+
+        @property
+        def alert_eligible(self) -> bool:
+            return eligible
+
+        def should_run(self, context):
+            return run
+
+        def detect(self, context):
+            if fail:
+                raise RuntimeError(f"{pattern_id} exploded")
+            return [
+                DetectorFinding(
+                    finding_id=f"XEW-F-{context.accession}-{pattern_id}",
+                    pattern_id=pattern_id,
+                    pattern_name=self.pattern_name,
+                    alert_eligible=True,
+                    status="detected",
+                )
+            ]
+
+    _Detector.__name__ = f"Detector_{pattern_id.replace('-', '_')}"
+    return _Detector
+
+
+class TestDetectorRegistry(unittest.TestCase):
+    """Test cases for DetectorRegistry execution."""
+
+    def setUp(self):
+        self.registry = DetectorRegistry()
+        self.context = Mock(spec=DetectorContext)
+        self.context.accession = "0000123456-23-000001"
+
+    def test_parallel_matches_serial(self):
+        """Parallel and serial runs return the same findings in the same order."""
+        for pattern_id in ("XEW-P001", "XEW-P002", "XEW-P004", "XEW-P005"):
+            self.registry.register(_make_detector_class(pattern_id))
+        patterns = ["XEW-P005", "XEW-P001", "XEW-P004", "XEW-P002"]
+
+        serial = self.registry.run_detectors(self.context, patterns)
+        parallel = self.registry.run_detectors(self.context, patterns, parallel=True)
+
+        self.assertEqual([f.pattern_id for f in serial], patterns)
+        self.assertEqual([f.finding_id for f in parallel], [f.finding_id for f in serial])
+
+    def test_should_run_false_is_skipped(self):
+        self.registry.register(_make_detector_class("XEW-P001"))
+        self.registry.register(_make_detector_class("XEW-P002", run=False))
+
+        findings = self.registry.run_detectors(self.context)
+        self.assertEqual([f.pattern_id for f in findings], ["XEW-P001"])
+
+    def test_unregistered_patterns_are_skipped_with_one_warning(self):
+        self.registry.register(_make_detector_class("XEW-P001"))
+        self.registry.register(_make_detector_class("XEW-P002"))
+
+        with self.assertLogs(self.registry.logger, level="WARNING") as logs:
+            findings = self.registry.run_detectors(
+                self.context, ["XEW-P002", "XEW-P777", "XEW-P001", "XEW-P999"]
+            )
+        self.assertEqual([f.pattern_id for f in findings], ["XEW-P002", "XEW-P001"])
+        skipped = [line for line in logs.output if "Unregistered patterns" in line]
+        self.assertEqual(len(skipped), 1)
+        self.assertIn("['XEW-P777', 'XEW-P999']", skipped[0])
+
+    def test_detector_failure_raises_detector_error(self):
+        self.registry.register(_make_detector_class("XEW-P001"))
+        self.registry.register(_make_detector_class("XEW-P002", fail=True))
+
+        with self.assertRaises(DetectorError) as ctx:
+            self.registry.run_detectors(self.context, ["XEW-P001", "XEW-P002"])
+        self.assertEqual(ctx.exception.detector_name, "XEW-P002")
+        self.assertIsInstance(ctx.exception.cause, RuntimeError)
+
+    def test_strict_serial_run_stops_at_first_failure(self):
+        self.registry.register(_make_detector_class("XEW-P001", fail=True))
+        self.registry.register(_make_detector_class("XEW-P002"))
+        later = self.registry.get_detector("XEW-P002")
+
+        with patch.object(later, "detect", wraps=later.detect) as detect:
+            with self.assertRaises(DetectorError):
+                self.registry.run_detectors(self.context, ["XEW-P001", "XEW-P002"])
+        detect.assert_not_called()
+
+    def test_non_strict_run_records_errors_and_continues(self):
+        self.registry.register(_make_detector_class("XEW-P001", fail=True))
+        self.registry.register(_make_detector_class("XEW-P002"))
+
+        findings = self.registry.run_detectors(
+            self.context, ["XEW-P001", "XEW-P002"], strict=False
+        )
+        self.assertEqual([f.pattern_id for f in findings], ["XEW-P002"])
+        self.assertEqual(self.registry.last_run_error_count, 1)
+        self.assertEqual([e.detector_name for e in self.registry.last_run_errors], ["XEW-P001"])
+
+        # Errors are reset per run.
+        self.registry.run_detectors(self.context, ["XEW-P002"], strict=False)
+        self.assertEqual(self.registry.last_run_errors, [])
+
+    def test_citation_sha256_validation(self):
+        citation = {
+            "source": "XBRL 2.1",
+            "retrieved_at": "2026-01-31T14:32:00Z",
+            "sha256": "aB" * 32,
+            "url": "https://example.com/spec",
+        }
+        self.assertTrue(self.registry._is_valid_citation(citation))
+
+        for bad in ("ab" * 31, "ab" * 32 + "a", "g" * 64, "ab" * 31 + "a\n"):
+            self.assertFalse(self.registry._is_valid_citation({**citation, "sha256": bad}), bad)
+
+    def test_alert_eligible_patterns_track_registration(self):
+        self.registry.register(_make_detector_class("XEW-P005"))
+        self.registry.register(_make_detector_class("XEW-P001"))
+        self.registry.register(_make_detector_class("XEW-P009", eligible=False))
+        self.assertEqual(self.registry.list_alert_eligible_patterns(), ["XEW-P001", "XEW-P005"])
+
+        self.registry.unregister("XEW-P001")
+        self.assertEqual(self.registry.list_alert_eligible_patterns(), ["XEW-P005"])
+
+    def test_priority_order_and_selection(self):
+        for pattern_id in ("XEW-P002", "XEW-P005", "XEW-P001"):
+            self.registry.register(_make_detector_class(pattern_id))
+        self.assertEqual(
+            self.registry.list_patterns_by_priority(), ["XEW-P001", "XEW-P005", "XEW-P002"]
+        )
+
+        self.registry.unregister("XEW-P001")
+        self.assertEqual(self.registry.list_patterns_by_priority(), ["XEW-P005", "XEW-P002"])
+
+        findings = [
+            DetectorFinding(
+                finding_id=f"XEW-F-{self.context.accession}-{pattern_id}",
+                pattern_id=pattern_id,
+                pattern_name=pattern_id,
+                alert_eligible=eligible,
+                status="detected",
+            )
+            for pattern_id, eligible in (
+                ("XEW-P002", True), ("XEW-P001", False), ("XEW-P005", True), ("XEW-P004", True)
+            )
+        ]
+        selected = self.registry.select_highest_priority_finding(findings)
+        self.assertEqual(selected.pattern_id, "XEW-P004")
+
+    def test_break_trigger_selected_once_per_pattern(self):
+        detector_class = _make_detector_class("XEW-P001")
+        calls = []
+
+        def get_break_triggers(self):
+            calls.append(1)
+            return [{"id": "XEW-BT004", "summary": "b"}, {"id": "XEW-BT001", "summary": "a"}]
+
+        detector_class.get_break_triggers = get_break_triggers
+        self.registry.register(detector_class)
+
+        for _ in range(3):
+            self.assertEqual(self.registry.select_break_trigger("XEW-P001")["id"], "XEW-BT001")
+        self.assertEqual(len(calls), 1)
+
+        # Callers get independent copies; editing one leaks into nothing else.
+        self.registry.select_break_trigger("XEW-P001")["id"] = "edited"
+        self.assertEqual(self.registry.select_break_trigger("XEW-P001")["id"], "XEW-BT001")
+
+        findings = self.registry.run_detectors(self.context, ["XEW-P001"])
+        findings[0].break_triggers[0]["summary"] = "edited"
+        rerun = self.registry.run_detectors(self.context, ["XEW-P001"])
+        self.assertEqual(rerun[0].break_triggers, [{"id": "XEW-BT001", "summary": "a"}])
+
+        # Re-registration invalidates the cached selection.
+        self.registry.unregister("XEW-P001")
+        self.registry.register(detector_class)
+        self.registry.select_break_trigger("XEW-P001")
+        self.assertEqual(len(calls), 2)
+
+    def test_class_attribute_detectors_are_instantiated_lazily(self):
+        created = []
+
+        class LazyDetector(BaseDetector):
+            pattern_id = "XEW-P005"
+            pattern_name = "Lazy"
+            alert_eligible = True
+
+            def __init__(self):
+                super().__init__()
+                created.append(self)
+
+            def detect(self, context):
+                return []
+
+        self.registry.register(LazyDetector)
+        self.assertEqual(self.registry.list_patterns(), ["XEW-P005"])
+        self.assertEqual(self.registry.list_alert_eligible_patterns(), ["XEW-P005"])
+        self.assertEqual(created, [])
+
+        detector = self.registry.get_detector("XEW-P005")
+        self.assertIs(self.registry.get_detector("XEW-P005"), detector)
+        self.assertEqual(len(created), 1)
+
+        self.registry.run_detectors(self.context)
+        self.assertEqual(len(created), 1)
+
+        self.registry.unregister("XEW-P005")
+        with self.assertRaises(ValueError):
+            self.registry.get_detector("XEW-P005")
+
+    def test_auto_discover_registers_shipped_detectors_once(self):
+        self.registry.auto_discover("cmdrvl_xew.detectors")
+        patterns = set(self.registry.list_patterns())
+        self.assertTrue({"XEW-P001", "XEW-P002", "XEW-P004", "XEW-P005"}.issubset(patterns))
+
+        modules = self.registry._discovery_cache["cmdrvl_xew.detectors"]
+        self.assertEqual(modules, sorted(modules))
+
+        # A second pass reuses the cached module list and leaves registrations unchanged.
+        self.registry.auto_discover("cmdrvl_xew.detectors")
+        self.assertIs(self.registry._discovery_cache["cmdrvl_xew.detectors"], modules)
+        self.assertEqual(set(self.registry.list_patterns()), patterns)
+
+    def test_find_detector_class_prefers_declared_class(self):
+        declared = _make_detector_class("XEW-P001")
+        other = _make_detector_class("XEW-P002")
+        module = types.SimpleNamespace(__name__="fake", DETECTOR_CLS=declared, AAA=other)
+        self.assertIs(_find_detector_class(module), declared)
+
+        # An invalid declaration falls back to the subclass defined in the module.
+        other.__module__ = "fake"
+        module = types.SimpleNamespace(__name__="fake", DETECTOR_CLS="nope")
+        self.assertIs(_find_detector_class(module), other)
+
+        # Subclasses defined elsewhere are not picked up.
+        module = types.SimpleNamespace(__name__="fake_without_detector")
+        self.assertIsNone(_find_detector_class(module))
+
+    def test_load_rule_basis_map_groups_by_pattern(self):
+        rules = [
+            {"pattern_id": "XEW-P001", "rule_id": "a"},
+            {"pattern_id": "XEW-P005", "rule_id": "b"},
+            {"pattern_id": "XEW-P001", "rule_id": "c"},
+            {"rule_id": "orphan"},
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "rule_basis.json"
+            path.write_text(json.dumps({"rules": rules}), encoding="utf-8")
+            self.registry.load_rule_basis_map(path)
+
+        self.assertEqual([r["rule_id"] for r in self.registry.get_rule_basis("XEW-P001")], ["a", "c"])
+        self.assertEqual([r["rule_id"] for r in self.registry.get_rule_basis("XEW-P005")], ["b"])
+        self.assertEqual(self.registry.get_rule_basis("XEW-P002"), [])
+
+    def test_load_issue_codes_map_from_spec(self):
+        spec = Path(__file__).resolve().parents[1] / "src" / "cmdrvl_xew" / "spec" / "xew_issue_codes.v1.json"
+        self.registry.load_issue_codes_map(spec)
+        self.assertIn("namespace_schema_ref_mismatch", self.registry.get_issue_codes("XEW-P005"))
+        self.assertEqual(self.registry.get_issue_codes("XEW-P999"), [])
+
+    def test_load_rule_basis_map_invalid_json_raises(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "rule_basis.json"
+            path.write_text("{not json", encoding="utf-8")
+            with self.assertRaises(DetectorError):
+                self.registry.load_rule_basis_map(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+Unit tests for `cmdrvl-xew doctor` environment checks.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from cmdrvl_xew.doctor import (
+    _check_bundle_env,
+    _check_taxonomy_registry,
+    _read_doctor_env,
+    _resolve_arelle_xdg_config_home,
+)
+
+
+class TestDoctorEnv(unittest.TestCase):
+    def test_read_doctor_env_strips_and_defaults(self):
+        environ = {"XEW_ARELLE_BUNDLE_URI": "  s3://bucket/bundle.tgz \n", "XEW_USER_AGENT": ""}
+        with patch.dict(os.environ, environ, clear=True):
+            env = _read_doctor_env()
+        self.assertEqual(env["XEW_ARELLE_BUNDLE_URI"], "s3://bucket/bundle.tgz")
+        self.assertEqual(env["XEW_USER_AGENT"], "")
+        self.assertEqual(env["AWS_PROFILE"], "")
+
+    def test_bundle_env_checks(self):
+        env = {"XEW_ARELLE_BUNDLE_URI": "", "XEW_ARELLE_BUNDLE_SHA256": "", "AWS_PROFILE": ""}
+        self.assertEqual(_check_bundle_env(env).status, "WARN")
+
+        env.update(XEW_ARELLE_BUNDLE_URI="s3://bucket/bundle.tgz", XEW_ARELLE_BUNDLE_SHA256="ab" * 32)
+        self.assertIn("AWS_PROFILE", _check_bundle_env(env).message)
+
+        env["AWS_PROFILE"] = "prod"
+        self.assertEqual(_check_bundle_env(env).status, "OK")
+
+    def test_xdg_config_home_prefers_cli_value(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            env = {"XEW_ARELLE_XDG_CONFIG_HOME": str(Path(tmp) / "env")}
+            self.assertEqual(_resolve_arelle_xdg_config_home(None, env), (Path(tmp) / "env").resolve())
+            self.assertEqual(
+                _resolve_arelle_xdg_config_home(str(Path(tmp) / "cli"), env), (Path(tmp) / "cli").resolve()
+            )
+
+        default = _resolve_arelle_xdg_config_home(None, {"XEW_ARELLE_XDG_CONFIG_HOME": ""})
+        self.assertEqual(default, Path(tempfile.gettempdir()) / "cmdrvl-xew-arelle")
+
+
+class TestDoctorTaxonomyRegistry(unittest.TestCase):
+    def test_registry_states(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            registry = Path(tmp) / "taxonomyPackages.json"
+            self.assertIn("missing registry", _check_taxonomy_registry(registry).message)
+
+            registry.write_bytes(b"{not json")
+            self.assertIn("invalid registry JSON", _check_taxonomy_registry(registry).message)
+
+            registry.write_bytes(b'{"packages": []}')
+            self.assertIn("no packages", _check_taxonomy_registry(registry).message)
+
+            registry.write_bytes(b'{"packages": [{"name": "us-gaap"}, {"name": "dei"}]}')
+            check = _check_taxonomy_registry(registry)
+            self.assertEqual((check.status, check.message), ("OK", "2 package(s) installed"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,370 @@
+"""
+Unit tests for EDGAR accession fetching helpers.
+"""
+
+from __future__ import annotations
+
+import gzip
+import tempfile
+import threading
+import unittest
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+from urllib.error import HTTPError, URLError
+
+from cmdrvl_xew.edgar_fetch import (
+    EdgarDirectoryItem,
+    EdgarSession,
+    RateLimiter,
+    TokenBucket,
+    _validate_user_agent,
+    collect_accession_artifacts,
+    download_artifacts,
+    download_artifacts_cached,
+    fetch_accession_items,
+    parse_index_html,
+    parse_index_json,
+)
+
+_USER_AGENT = "cmdrvl-xew tests ops@example.com"
+
+_FILES = {
+    "/acc/a.htm": b"<html>primary</html>",
+    "/acc/b.xsd": b"<schema/>",
+    "/acc/b_lab.xml": b"<linkbase/>",
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = 0
+    user_agents: list[str] = []
+
+    def setup(self):
+        super().setup()
+        type(self).connections += 1
+
+    def do_GET(self):  # noqa: N802
+        type(self).user_agents.append(self.headers.get("User-Agent"))
+        if self.path == "/moved":
+            self.send_response(301)
+            self.send_header("Location", "/acc/a.htm")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/moved-host":
+            self.send_response(302)
+            self.send_header("Location", f"http://localhost:{self.server.server_address[1]}/acc/a.htm")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = _FILES.get(self.path)
+        if body is None:
+            body = b"not found"
+            self.send_response(404)
+        else:
+            self.send_response(200)
+        # Compress schemas only, so both encoded and identity bodies are exercised.
+        if self.path.endswith(".xsd") and "gzip" in (self.headers.get("Accept-Encoding") or ""):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestEdgarSession(unittest.TestCase):
+    def setUp(self):
+        _Handler.connections = 0
+        _Handler.user_agents = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        self.thread.start()
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        # Keep proxy settings from the environment out of the way.
+        patcher = patch("cmdrvl_xew.edgar_fetch.urllib.request.getproxies", return_value={})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_downloads_reuse_one_connection(self):
+        items = [EdgarDirectoryItem(name=name) for name in ("b_lab.xml", "a.htm", "b.xsd")]
+        with tempfile.TemporaryDirectory() as tmp:
+            saved = download_artifacts(
+                f"{self.base}/acc", items, Path(tmp),
+                user_agent=_USER_AGENT, min_interval_seconds=0, max_workers=1,
+            )
+            self.assertEqual([p.name for p in saved], ["a.htm", "b.xsd", "b_lab.xml"])
+            for path in saved:
+                self.assertEqual(path.read_bytes(), _FILES[f"/acc/{path.name}"])
+
+        self.assertEqual(_Handler.connections, 1)
+        self.assertEqual(_Handler.user_agents, [_USER_AGENT] * 3)
+
+    def test_concurrent_downloads_reuse_callers_connection(self):
+        items = [EdgarDirectoryItem(name=name) for name in ("b_lab.xml", "a.htm", "b.xsd")]
+        with tempfile.TemporaryDirectory() as tmp, EdgarSession() as session:
+            # Stands in for the index fetch that opens the session's connection.
+            with session.open(f"{self.base}/acc/a.htm", headers={}) as resp:
+                resp.read()
+            index_conn = session._connections[("http", self.base[len("http://"):])]
+
+            with patch.object(session, "open", wraps=session.open) as session_open:
+                download_artifacts(
+                    f"{self.base}/acc", items, Path(tmp),
+                    user_agent=_USER_AGENT, min_interval_seconds=0, session=session,
+                )
+            self.assertGreaterEqual(session_open.call_count, 1)
+            self.assertIs(session._connections[("http", self.base[len("http://"):])], index_conn)
+
+        # The index connection plus at most one private connection per other worker.
+        self.assertLessEqual(_Handler.connections, 3)
+
+    def test_cached_download_keeps_caller_order_and_skips_repeats(self):
+        items = [EdgarDirectoryItem(name=name) for name in ("b_lab.xml", "a.htm", "b.xsd", "b_lab.xml")]
+        with tempfile.TemporaryDirectory() as tmp:
+            saved, metadata = download_artifacts_cached(
+                f"{self.base}/acc", items, Path(tmp), user_agent=_USER_AGENT, min_interval_seconds=0,
+            )
+            self.assertEqual([p.name for p in saved], ["b_lab.xml", "a.htm", "b.xsd"])
+            self.assertEqual(metadata, [])
+        self.assertEqual(len(_Handler.user_agents), 3)
+
+    def test_concurrent_downloads_keep_name_order(self):
+        items = [EdgarDirectoryItem(name=name) for name in ("b_lab.xml", "a.htm", "b.xsd")]
+        with tempfile.TemporaryDirectory() as tmp:
+            saved = download_artifacts(
+                f"{self.base}/acc", items, Path(tmp), user_agent=_USER_AGENT, min_interval_seconds=0
+            )
+            self.assertEqual([p.name for p in saved], ["a.htm", "b.xsd", "b_lab.xml"])
+            for path in saved:
+                self.assertEqual(path.read_bytes(), _FILES[f"/acc/{path.name}"])
+
+    def test_concurrent_downloads_fetch_repeated_names_once(self):
+        items = [EdgarDirectoryItem(name=name) for name in ("b.xsd", "a.htm", "b.xsd", "a.htm", "b.xsd")]
+        with tempfile.TemporaryDirectory() as tmp:
+            saved = download_artifacts(
+                f"{self.base}/acc", items, Path(tmp),
+                user_agent=_USER_AGENT, min_interval_seconds=0, max_workers=4,
+            )
+            self.assertEqual([p.name for p in saved], ["a.htm", "b.xsd"])
+            for path in saved:
+                self.assertEqual(path.read_bytes(), _FILES[f"/acc/{path.name}"])
+            self.assertEqual(sorted(p.name for p in Path(tmp).iterdir()), ["a.htm", "b.xsd"])
+        self.assertEqual(len(_Handler.user_agents), 2)
+
+    def test_concurrent_download_failure_propagates(self):
+        items = [EdgarDirectoryItem(name=name) for name in ("a.htm", "missing.xml", "b.xsd")]
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaises(HTTPError):
+                download_artifacts(
+                    f"{self.base}/acc", items, Path(tmp), user_agent=_USER_AGENT, min_interval_seconds=0
+                )
+            self.assertFalse(list(Path(tmp).glob("*.part")))
+
+    def test_redirects_and_errors(self):
+        with EdgarSession() as session:
+            with session.open(f"{self.base}/moved", headers={"User-Agent": _USER_AGENT}) as resp:
+                self.assertEqual(resp.read(), _FILES["/acc/a.htm"])
+
+            with self.assertRaises(HTTPError) as ctx:
+                with session.open(f"{self.base}/missing", headers={"User-Agent": _USER_AGENT}):
+                    pass
+            self.assertEqual(ctx.exception.code, 404)
+
+            # The connection stays usable after an error response.
+            with session.open(f"{self.base}/acc/b.xsd", headers={"User-Agent": _USER_AGENT}) as resp:
+                self.assertEqual(resp.read(), _FILES["/acc/b.xsd"])
+
+        self.assertEqual(_Handler.connections, 1)
+
+    def test_redirect_to_proxied_host_uses_urlopen(self):
+        def uses_proxy(scheme, netloc):
+            return netloc.startswith("localhost:")
+
+        with patch("cmdrvl_xew.edgar_fetch._uses_proxy", side_effect=uses_proxy), \
+                patch("cmdrvl_xew.edgar_fetch.urllib.request.urlopen",
+                      wraps=urllib.request.urlopen) as urlopen:
+            with EdgarSession() as session:
+                with session.open(f"{self.base}/moved-host", headers={"User-Agent": _USER_AGENT}) as resp:
+                    self.assertEqual(resp.read(), _FILES["/acc/a.htm"])
+
+        urlopen.assert_called_once()
+        self.assertTrue(urlopen.call_args.args[0].full_url.startswith("http://localhost:"))
+        self.assertEqual(_Handler.user_agents, [_USER_AGENT] * 2)
+
+    def test_partially_read_response_drops_connection(self):
+        with EdgarSession() as session:
+            with session.open(f"{self.base}/acc/a.htm", headers={"User-Agent": _USER_AGENT}) as resp:
+                resp.read(3)
+            with session.open(f"{self.base}/acc/b.xsd", headers={"User-Agent": _USER_AGENT}) as resp:
+                self.assertEqual(resp.read(), _FILES["/acc/b.xsd"])
+
+        self.assertEqual(_Handler.connections, 2)
+
+
+class TestParseIndex(unittest.TestCase):
+    def test_parse_index_html_skips_navigation_links(self):
+        html = (
+            '<table><tr><td><a href="../">Parent Directory</a></td></tr>'
+            '<tr><td><a href="Parent.htm">x</a></td></tr>'
+            '<tr><td><a href="INDEX.HTM">index</a></td></tr>'
+            '<tr><td><a href="abc-20231231.htm">abc</a></td></tr>'
+            '<tr><td><a  href="spaced.htm">not an EDGAR listing link</a></td></tr>'
+            '<tr><td><a href="abc-20231231.xsd">xsd</a></td></tr>'
+            '<a href="unterminated'
+        )
+        self.assertEqual(
+            [item.name for item in parse_index_html(html)],
+            ["abc-20231231.htm", "abc-20231231.xsd"],
+        )
+
+
+    def test_parse_index_json_items(self):
+        text = (
+            '{"directory": {"item": ['
+            '{"name": " a.htm ", "type": "text.gif", "size": "2048", "last-modified": "2024-02-01 10:00:00"},'
+            '{"name": "b.xsd", "size": 17},'
+            '{"name": ""}, "junk", {"name": "c.xml", "size": "n/a", "last_modified": "x"}'
+            ']}}'
+        )
+        items = parse_index_json(text)
+        self.assertEqual(
+            [(i.name, i.type, i.size, i.last_modified) for i in items],
+            [
+                ("a.htm", "text.gif", 2048, "2024-02-01 10:00:00"),
+                ("b.xsd", None, 17, None),
+                ("c.xml", None, None, "x"),
+            ],
+        )
+        self.assertFalse(hasattr(items[0], "__dict__"))
+
+    def test_size_coercion_matches_int(self):
+        text = (
+            '{"directory": {"item": ['
+            '{"name": "a", "size": " 12 "}, {"name": "b", "size": "\\u00b2"},'
+            '{"name": "c", "size": "-4"}, {"name": "d", "size": 3.0}, {"name": "e", "size": ""}'
+            ']}}'
+        )
+        self.assertEqual([i.size for i in parse_index_json(text)], [12, None, -4, 3, None])
+
+
+class TestFetchAccessionItems(unittest.TestCase):
+    _INDEX_HTML = '<a href="../">up</a><a href="a.htm">a.htm</a>'
+
+    def _fetch(self, json_error: Exception) -> list[str]:
+        requested: list[str] = []
+
+        def fake_fetch_text(url, **kwargs):
+            requested.append(url.rsplit("/", 1)[-1])
+            if url.endswith("index.json"):
+                raise json_error
+            return self._INDEX_HTML
+
+        with patch("cmdrvl_xew.edgar_fetch._fetch_text", side_effect=fake_fetch_text):
+            items = fetch_accession_items("320193", "0000320193-24-000001", user_agent=_USER_AGENT)
+        self.assertEqual([item.name for item in items], ["a.htm"])
+        return requested
+
+    def test_missing_or_malformed_json_index_falls_back_to_html(self):
+        missing = HTTPError("index.json", 404, "Not Found", {}, None)
+        self.assertEqual(self._fetch(missing), ["index.json", "index.html"])
+        self.assertEqual(self._fetch(ValueError("bad json")), ["index.json", "index.html"])
+
+    def test_other_failures_are_not_masked_by_html_fallback(self):
+        for error in (HTTPError("index.json", 503, "Unavailable", {}, None), URLError("refused")):
+            with self.assertRaises(type(error)):
+                self._fetch(error)
+
+
+class TestCollectAccessionArtifacts(unittest.TestCase):
+    def test_primary_and_extensions_from_one_listing(self):
+        listing = [
+            EdgarDirectoryItem(name="R1.htm", size=900),
+            EdgarDirectoryItem(name="ex31.htm", size=800),
+            EdgarDirectoryItem(name="big.htm", size=700),
+            EdgarDirectoryItem(name="abc-20240331.htm", size=10),
+            EdgarDirectoryItem(name="0001-index.htm", size=1000),
+            EdgarDirectoryItem(name="abc-20240331_lab.xml"),
+            EdgarDirectoryItem(name="abc-20240331.xsd"),
+            EdgarDirectoryItem(name="Financial_Report.xlsx"),
+        ]
+        # A one-shot iterator works: the listing is scanned once.
+        primary, extensions = collect_accession_artifacts(iter(listing))
+        self.assertEqual(primary.name, "abc-20240331.htm")
+        self.assertEqual([i.name for i in extensions], ["abc-20240331.xsd", "abc-20240331_lab.xml"])
+
+    def test_largest_non_report_page_wins_without_matching_schema(self):
+        listing = [
+            EdgarDirectoryItem(name="R2.htm", size=5000),
+            EdgarDirectoryItem(name="b.htm", size=None),
+            EdgarDirectoryItem(name="a.htm", size=300),
+            EdgarDirectoryItem(name="c.htm", size=300),
+        ]
+        primary, extensions = collect_accession_artifacts(listing)
+        self.assertEqual(primary.name, "a.htm")
+        self.assertEqual(extensions, [])
+
+        with self.assertRaises(ValueError):
+            collect_accession_artifacts([EdgarDirectoryItem(name="ex99.htm")])
+
+
+class TestTokenBucket(unittest.TestCase):
+    def _run(self, bucket: TokenBucket, calls: int, clock: list[float]) -> list[float]:
+        sleeps: list[float] = []
+
+        def fake_sleep(seconds: float) -> None:
+            sleeps.append(round(seconds, 6))
+            clock[0] += seconds
+
+        with patch("cmdrvl_xew.edgar_fetch.time.monotonic", side_effect=lambda: clock[0]), \
+                patch("cmdrvl_xew.edgar_fetch.time.sleep", side_effect=fake_sleep):
+            for _ in range(calls):
+                bucket.wait()
+        return sleeps
+
+    def test_min_interval_spacing(self):
+        clock = [100.0]
+        with patch("cmdrvl_xew.edgar_fetch.time.monotonic", return_value=clock[0]):
+            bucket = RateLimiter(0.2)
+        self.assertEqual(self._run(bucket, 3, clock), [0.2, 0.2])
+
+    def test_burst_up_to_capacity(self):
+        clock = [100.0]
+        with patch("cmdrvl_xew.edgar_fetch.time.monotonic", return_value=clock[0]):
+            bucket = TokenBucket(capacity=3, rate=10.0)
+        self.assertEqual(self._run(bucket, 4, clock), [0.1])
+
+    def test_zero_interval_never_sleeps(self):
+        self.assertEqual(self._run(RateLimiter(0), 5, [0.0]), [])
+
+    def test_capacity_and_rate_are_required(self):
+        with self.assertRaises(TypeError):
+            TokenBucket()
+
+
+class TestValidateUserAgent(unittest.TestCase):
+    def test_valid_user_agent_is_returned_and_memoized(self):
+        _validate_user_agent.cache_clear()
+        self.assertEqual(_validate_user_agent(_USER_AGENT), _USER_AGENT)
+        self.assertEqual(_validate_user_agent(_USER_AGENT), _USER_AGENT)
+        self.assertEqual(_validate_user_agent.cache_info().hits, 1)
+
+    def test_invalid_user_agent_raises_every_time(self):
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                _validate_user_agent("Python-urllib/3.11")
+            with self.assertRaises(ValueError):
+                _validate_user_agent("no contact details")
+
+
+if __name__ == "__main__":
+    unittest.main()
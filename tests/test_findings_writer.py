@@ -4,7 +4,9 @@ import json
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
+from cmdrvl_xew import util
 from cmdrvl_xew.findings import FindingsWriter
 from cmdrvl_xew.detectors._base import DetectorContext, DetectorFinding, DetectorInstance
 
@@ -98,5 +100,118 @@ class TestFindingsWriterSuppressed(unittest.TestCase):
             )
 
 
+class TestFindingsWriterTruncation(unittest.TestCase):
+    """Large instance lists keep the lowest 100 instance_ids, converting only those."""
+
+    def test_truncation_keeps_lowest_instance_ids(self):
+        ids = [f"i{n:04d}" for n in range(250)]
+        instances = [
+            DetectorInstance(instance_id=iid, kind="k", primary=False, data={"n": iid})
+            for iid in reversed(ids)
+        ]
+        finding = DetectorFinding(
+            finding_id="XEW-F-0000000000-00-000000-XEW-P999",
+            pattern_id="XEW-P999",
+            pattern_name="Many",
+            alert_eligible=False,
+            status="detected",
+            instances=instances,
+        )
+        writer = FindingsWriter(Path("unused.json"))
+        with patch.object(writer, "_convert_instance_to_json", wraps=writer._convert_instance_to_json) as convert:
+            observed = writer._convert_finding_to_json(finding)["observed"]
+
+        self.assertEqual(convert.call_count, 100)
+        self.assertEqual(observed["instance_count_total"], 250)
+        self.assertEqual(observed["instance_count_included"], 100)
+        self.assertTrue(observed["truncated"])
+        self.assertEqual([i["instance_id"] for i in observed["instances"]], ids[:100])
+
+
+class TestRuleBasisNormalization(unittest.TestCase):
+    """Citation sha256 values are kept only when they are 64 hex digits."""
+
+    def test_sha256_validation(self):
+        writer = FindingsWriter(Path("unused.json"))
+        citation = {"source": "SEC EFM 6.5.20", "citation": "EFM 6.5.20"}
+
+        normalized = writer._normalize_rule_basis_citation({**citation, "sha256": "aB" * 32})
+        self.assertEqual(normalized["source"], "SEC_EFM")
+        self.assertEqual(normalized["sha256"], "ab" * 32)
+
+        for bad in ("ab" * 31, "g" * 64, "ab" * 31 + "a\n", "ab" * 31 + " a", "\u00e9" * 64):
+            normalized = writer._normalize_rule_basis_citation({**citation, "sha256": bad})
+            self.assertNotIn("sha256", normalized, repr(bad))
+
+
+class TestFindingsWriterGeneratedAt(unittest.TestCase):
+    """generated_at is injectable and defaults to a second-precision UTC stamp."""
+
+    def _build(self, **kwargs):
+        writer = FindingsWriter(Path("unused.json"))
+        return writer._build_findings_document([], None, [], {}, {}, **kwargs)
+
+    def test_injected_timestamp_is_used_verbatim(self):
+        doc = self._build(generated_at="2025-01-01T00:00:00Z")
+        self.assertEqual(doc["generated_at"], "2025-01-01T00:00:00Z")
+
+    def test_default_timestamp_has_second_precision(self):
+        with patch("cmdrvl_xew.findings.utc_now_iso", return_value="2026-02-01T13:47:43Z") as now:
+            doc = self._build()
+        self.assertEqual(doc["generated_at"], "2026-02-01T13:47:43Z")
+        now.assert_called_once_with()
+        self.assertRegex(self._build()["generated_at"], r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$")
+
+
+class TestFindingsWriterAtomicWrite(unittest.TestCase):
+    """The findings file is replaced whole or left untouched."""
+
+    def test_failed_write_keeps_previous_output(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = Path(tmp_dir) / "xew_findings.json"
+            writer = FindingsWriter(output_path)
+
+            writer._write_json_deterministically({"b": 1, "a": [1, 2]})
+            first = output_path.read_bytes()
+            self.assertEqual(json.loads(first), {"a": [1, 2], "b": 1})
+
+            with patch("cmdrvl_xew.findings.os.replace", side_effect=OSError("disk full")):
+                with self.assertRaises(OSError):
+                    writer._write_json_deterministically({"a": 2})
+
+            self.assertEqual(output_path.read_bytes(), first)
+            self.assertEqual(sorted(p.name for p in Path(tmp_dir).iterdir()), ["xew_findings.json"])
+
+
+class TestPrettyJsonEncoding(unittest.TestCase):
+    """Findings bytes must not depend on whether orjson is installed."""
+
+    DOCS = [
+        {"b": [1, {"z": {}, "a": []}], "a": "caf\u00e9 \u20ac \U0001f600 \x1f\"\\", "c": None, "d": True},
+        {"big": 2**64 - 1, "small": -(2**63), "huge": 2**70},
+        {"float": 1e-07, "nan": float("nan"), "neg": -0.0},
+        {"fixed": [0.0, -0.0, 0.1, 1.5, 1e-4, 123456.789, 9999999999999998.0, 2.0**53, -1 / 3]},
+        {"exponent": [1e16, 9.999999999999999e-05, 5e-324, 1.7976931348623157e308]},
+        {"tuple": ("x", 1), "\u00e9": 1, "e": 2, "\U0001f600": 3},
+        [],
+    ]
+
+    def test_matches_stdlib_encoder(self):
+        for doc in self.DOCS:
+            expected = json.dumps(
+                doc, indent=2, sort_keys=True, ensure_ascii=False, separators=(",", ": ")
+            ).encode("utf-8")
+            self.assertEqual(util.dumps_json_pretty(doc), expected)
+            with patch.object(util, "_orjson", None):
+                self.assertEqual(util.dumps_json_pretty(doc), expected)
+
+    def test_unsupported_types_use_stdlib(self):
+        self.assertTrue(util._orjson_renders_identically({"x": [1.5, -0.0, 1e-4]}))
+        for value in (1e16, -1e-5, float("inf"), float("nan")):
+            self.assertFalse(util._orjson_renders_identically({"x": [value]}), value)
+        self.assertFalse(util._orjson_renders_identically({1: "int key"}))
+        self.assertTrue(util._orjson_renders_identically({"x": [1, "a", None, False, ("t",)]}))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -3,7 +3,12 @@ import tempfile
 from pathlib import Path
 import unittest
 
-from cmdrvl_xew.flatten import run_flatten
+from cmdrvl_xew.flatten import (
+    _copy_with_optional_wrapper_strip,
+    _extract_schema_ref,
+    _find_extension_files,
+    run_flatten,
+)
 
 
 def _write_fixture(root: Path, form_dir: str, basename: str) -> tuple[Path, Path]:
@@ -68,5 +73,75 @@ class TestFlattenAdditionalForms(unittest.TestCase):
         self._run_flatten("8-K")
 
 
+class TestFindExtensionFiles(unittest.TestCase):
+    def test_only_expected_names_in_their_own_directory_match(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            edgar_dir, _out_dir = _write_fixture(Path(tmp), "10-Q", "sample-20240101")
+            # Linkbase filed under the wrong exhibit, and an unrelated schema.
+            (edgar_dir / "EX-101.SCH" / "sample-20240101_cal.xml").write_text("x", encoding="utf-8")
+            (edgar_dir / "EX-101.SCH" / "other-20240101.xsd").write_text("x", encoding="utf-8")
+            (edgar_dir / "EX-101.PRE").rename(edgar_dir / "EX-101.PRE.bak")
+
+            found = _find_extension_files(edgar_dir, "sample-20240101")
+
+            self.assertEqual(
+                {name: path.parent.name for name, path in found.items()},
+                {
+                    "sample-20240101.xsd": "EX-101.SCH",
+                    "sample-20240101_cal.xml": "EX-101.CAL",
+                    "sample-20240101_def.xml": "EX-101.DEF",
+                    "sample-20240101_lab.xml": "EX-101.LAB",
+                },
+            )
+
+
+class TestExtractSchemaRef(unittest.TestCase):
+    def _extract(self, content: bytes) -> str | None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "primary.htm"
+            path.write_bytes(content)
+            return _extract_schema_ref(path)
+
+    def test_schema_ref_variants(self) -> None:
+        cases = {
+            b'<link:schemaRef xlink:type="simple" xlink:href="a-20240101.xsd"/>': "a-20240101.xsd",
+            b"<LINK:SCHEMAREF XLINK:HREF = 'b.xsd' xlink:type='simple'/>": "b.xsd",
+            b'\xff\xfe garbage <schemaRef href="https://x.test/c.xsd"/>': "https://x.test/c.xsd",
+            b'<link:schemaRef xlink:href="caf\xc3\xa9.xsd"/>': "caf\u00e9.xsd",
+            b"<html>no reference</html>": None,
+            b'<!-- schemaRef below --><div/><link:schemaRef xlink:href="d.xsd"/>': "d.xsd",
+            b'<link:schemaRef xlink:type="simple"/>': None,
+        }
+        for content, expected in cases.items():
+            self.assertEqual(self._extract(content), expected, content)
+
+    def test_only_the_leading_chunk_is_scanned(self) -> None:
+        late = b" " * (64 * 1024) + b'<link:schemaRef xlink:href="late.xsd"/>'
+        self.assertIsNone(self._extract(late))
+
+
+class TestWrapperStripCopy(unittest.TestCase):
+    def _copy(self, content: bytes) -> tuple[bool, bytes]:
+        with tempfile.TemporaryDirectory() as tmp:
+            src = Path(tmp) / "src.xml"
+            dst = Path(tmp) / "out" / "dst.xml"
+            src.write_bytes(content)
+            changed = _copy_with_optional_wrapper_strip(src, dst)
+            return changed, dst.read_bytes()
+
+    def test_unwrapped_files_are_copied_verbatim(self) -> None:
+        for content in (b"", b"<xbrl-ish/>", b"<doc>" + b"x" * 10000 + b"</doc>\n", b"<XBRL><doc/>"):
+            self.assertEqual(self._copy(content), (False, content))
+
+    def test_wrapped_files_are_stripped(self) -> None:
+        inner = b"<?xml version='1.0'?><schema>" + b"x" * 10000 + b"</schema>"
+        for content in (
+            b"<XBRL>\n" + inner + b"\n</XBRL>\n",
+            b"RL>" + inner + b"\n</xbrl>",
+            b" " * 5000 + b"<xbrl>" + inner + b"\n</XBRL>" + b"\n" * 5000,
+        ):
+            self.assertEqual(self._copy(content), (True, inner))
+
+
 if __name__ == "__main__":
     unittest.main()
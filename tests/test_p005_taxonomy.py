@@ -210,6 +210,31 @@ class TestTaxonomyInconsistencyDetector(unittest.TestCase):
         findings = self.detector.detect(self.mock_context)
         self.assertEqual(len(findings), 0)
 
+    def test_included_schema_declares_namespace(self):
+        """Namespaces imported by an xs:include'd schema count as declared."""
+        self._write_primary(schema_refs=["ext.xsd"])
+        padding = "".join(f"<!-- {i:06d} -->" for i in range(6000))  # > one read chunk
+        (self.root_dir / "ext.xsd").write_text(
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" targetNamespace="http://example.com/ext">\n'
+            f"{padding}\n"
+            '<xs:include schemaLocation="ext-part.xsd"/>\n'
+            "</xs:schema>\n",
+            encoding="utf-8",
+        )
+        self._write_schema(
+            "ext-part.xsd",
+            target_namespace="http://example.com/ext",
+            imports=["http://example.com/gaap"],
+        )
+        xbrl_model = self._create_mock_xbrl_model(
+            fact_namespaces=["http://example.com/ext", "http://example.com/gaap"]
+        )
+        self.mock_context.xbrl_model = xbrl_model
+
+        findings = self.detector.detect(self.mock_context)
+        self.assertEqual(len(findings), 0)
+
     def test_break_triggers(self):
         """Test that break triggers are properly defined."""
         triggers = self.detector.get_break_triggers()